@@ -1,3 +1,4 @@
+import asyncio
 import os
 from datetime import datetime
 
@@ -5,8 +6,27 @@ from dotenv import load_dotenv
 
 from src.fight_simulator import FightSimulator
 from src.parsers.bracket_file_parser import BracketFileParser
+from src.rate_limiter import RateLimiter
 from src.tournament import Tournament
 
+# Submit each round through the Message Batches API: about half the cost,
+# but a round can take several minutes to come back.
+USE_BATCH_API = False
+
+# API limits for your Anthropic account (defaults are Tier 1). Each fight sends
+# roughly 800 input tokens, so TOKENS_PER_MINUTE is usually the binding limit:
+# raise both to match your tier to let more fights run in parallel.
+REQUESTS_PER_MINUTE = 40
+TOKENS_PER_MINUTE = 16_000
+# Most fights in flight at once, across all divisions
+MAX_CONCURRENT_FIGHTS = 16
+
+
+async def run_tournament(tournament: Tournament, simulator: FightSimulator) -> None:
+    async with simulator:
+        await simulator.warm_up()
+        await tournament.run_async()
+
 
 def main() -> None:
     load_dotenv()
@@ -14,7 +34,10 @@ def main() -> None:
     parser = BracketFileParser()
     bracket = parser.parse("input/bracket.txt")
 
-    simulator = FightSimulator()  # Auto-detects mock mode if API key not set
+    rate_limiter = RateLimiter(
+        requests_per_minute=REQUESTS_PER_MINUTE, tokens_per_minute=TOKENS_PER_MINUTE
+    )
+    simulator = FightSimulator(rate_limiter=rate_limiter)  # Auto-detects mock mode if API key not set
     if simulator.mock_mode:
         print("No ANTHROPIC_API_KEY found — running in mock mode.")
     else:
@@ -23,8 +46,14 @@ def main() -> None:
     timestamp = datetime.now().strftime("%m_%d_%Y-%H_%M_%S")
     output_file = f"output/{timestamp}.txt"
 
-    tournament = Tournament(bracket, simulator, output_file)
-    tournament.run()
+    tournament = Tournament(
+        bracket,
+        simulator,
+        output_file,
+        max_concurrent=MAX_CONCURRENT_FIGHTS,
+        use_batch_api=USE_BATCH_API,
+    )
+    asyncio.run(run_tournament(tournament, simulator))
 
     print(f"Tournament complete! Results written to {output_file}")
 
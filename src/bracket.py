@@ -13,7 +13,7 @@ FINAL_FOUR_PAIRS = [("West", "East"), ("South", "Midwest")]
 ROUND_ONE_BRACKET = [(1, 16), (8, 9), (5, 12), (4, 13), (6, 11), (3, 14), (7, 10), (2, 15)]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Team:
     name: str
     seed: int  # 1 = best (1-seed), 16 = worst (16-seed)
@@ -22,10 +22,27 @@ class Team:
         return self.name
 
 
-@dataclass
+@dataclass(slots=True)
 class Division:
     name: str
     teams: list  # list[Team]
+    # seed -> Team, built on first use from the list object in _indexed_teams
+    _seed_index: dict = field(default=None, init=False, repr=False, compare=False)
+    _indexed_teams: list = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def seed_index(self) -> dict:
+        """
+        Map of seed to Team for the division's current teams.
+
+        Rebuilt whenever teams has been reassigned since the last build. Edits
+        made in place (e.g. division.teams[i] = ...) are not detected, so
+        assign a new list instead.
+        """
+        if self._indexed_teams is not self.teams:
+            self._seed_index = {team.seed: team for team in self.teams}
+            self._indexed_teams = self.teams
+        return self._seed_index
 
 
 @dataclass
@@ -57,11 +74,12 @@ class Bracket:
         Returns:
             List of (Team, Team) tuples.
         """
-        teams = self.divisions[division_name].teams
+        division = self.divisions[division_name]
+        teams = division.teams
         n = len(teams)
 
         if n == 16:
-            seed_to_team = {team.seed: team for team in teams}
+            seed_to_team = division.seed_index
             return [(seed_to_team[s1], seed_to_team[s2]) for s1, s2 in ROUND_ONE_BRACKET]
 
         # Subsequent rounds: pair consecutive slots
@@ -1,11 +1,60 @@
+import asyncio
+import dataclasses
+import functools
+import hashlib
 import json
 import os
 import random
 import re
+import shelve
+import zlib
+from pathlib import Path
 
 from src.fight_result import FightResult
+from src.rate_limiter import RateLimiter
 
 CLAUDE_MODEL = "claude-haiku-4-5-20251001"
+# A 2-3 sentence narrative plus the JSON wrapper is ~120-170 tokens
+CLAUDE_MAX_TOKENS = 256
+CLAUDE_TEMPERATURE = 0.7
+BATCH_POLL_INTERVAL_SECONDS = 10
+HTTP_TIMEOUT_SECONDS = 60.0
+HTTP_CONNECT_TIMEOUT_SECONDS = 5.0
+DEFAULT_CACHE_PATH = "output/.fight_cache"
+CHARS_PER_TOKEN = 4  # Rough input-token estimate for rate limiting
+MAX_API_ATTEMPTS = 6
+INITIAL_BACKOFF_SECONDS = 0.5  # Doubles after each failed attempt
+BACKOFF_JITTER_SECONDS = 0.25
+MOCK_CACHE_SIZE = 4096
+
+# Sampling settings are sent as raw body fields (extra_body on streamed calls)
+# because some SDK releases allowed by requirements.txt have no keyword argument
+# for them on messages.stream() / messages.create()
+_SAMPLING_PARAMS = {"temperature": CLAUDE_TEMPERATURE}
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+@functools.cache
+def _anthropic():
+    """
+    Import the anthropic SDK on first use and keep the module.
+
+    Mock mode never calls this, so mock simulators (and the test suite) never
+    pay for importing the SDK.
+
+    Raises:
+        ImportError: If the anthropic package is not installed.
+    """
+    try:
+        import anthropic
+    except ImportError as e:
+        raise ImportError(
+            "The anthropic package is required unless mock_mode is used. "
+            "Install it with `pip install -r requirements.txt`."
+        ) from e
+    return anthropic
+
 
 MOCK_NARRATIVES = [
     "{winner} dominated {loser} from the opening bell. The {loser} barely had time to react before the decisive blow ended it all.",
@@ -15,12 +64,11 @@ MOCK_NARRATIVES = [
     "{winner} used superior reach and ferocity to keep {loser} off-balance all fight, landing a haymaker that sealed the deal.",
 ]
 
-CLAUDE_PROMPT_TEMPLATE = """You are the official referee and narrator for the Mascot Fight Simulator, a tournament where college sports mascots battle each other for supremacy.
-
-Two mascots are about to fight. Simulate this battle and return the result as JSON.
+# Static rules, identical for every fight. Sent as the system prompt and marked
+# for prompt caching so repeat calls can reuse the processed prefix.
+CLAUDE_SYSTEM_PROMPT = """You are the official referee and narrator for the Mascot Fight Simulator, a tournament where college sports mascots battle each other for supremacy.
 
-FIGHTER 1: {team1}
-FIGHTER 2: {team2}
+Two mascots are about to fight; the user message names them as FIGHTER 1 and FIGHTER 2. Simulate this battle and return the result as JSON.
 
 JUDGING CRITERIA — weigh each factor when deciding the winner:
 1. Animal/creature strength and physicality (size, natural weapons, predator vs. prey)
@@ -51,78 +99,398 @@ EXAMPLES:
 "High in the thin air of the Rocky Mountains, the Buffalo charged with a thunder of hooves, a wall of muscle and horn that cracked stone on impact. The Seminole sidestepped with veteran calm, driving a burning spear into the beast’s shoulder and finishing it with a close range knife strike as it stumbled past in a spray of dust and blood. When the echoes faded, the warrior stood over the fallen titan, chest heaving but eyes unshaken."
 
 RESPONSE FORMAT — return ONLY valid JSON with no markdown, no code blocks, no extra text:
-{{"winner": "<exact team name as provided above>", "win_probability": <integer 51-100>, "narrative": "<2-3 sentence fight description>"}}"""
+{"winner": "<exact team name as provided in the user message>", "win_probability": <integer 51-100>, "narrative": "<2-3 sentence fight description>"}"""
+
+# The only part of the prompt that changes between fights
+CLAUDE_PROMPT_TEMPLATE = """FIGHTER 1: {team1}
+FIGHTER 2: {team2}"""
+
+# CLAUDE_PROMPT_TEMPLATE pre-split around its placeholders, so building a prompt
+# is plain concatenation instead of a str.format parse on every fight
+_PROMPT_PREFIX, _PROMPT_MIDDLE, _PROMPT_SUFFIX = re.split(
+    r"\{team[12]\}", CLAUDE_PROMPT_TEMPLATE
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _settings_digest(*settings) -> str:
+    """Short, stable digest of the request settings a cached result was generated with."""
+    return hashlib.blake2b(json.dumps(settings).encode(), digest_size=8).hexdigest()
+
+
+@functools.lru_cache(maxsize=MOCK_CACHE_SIZE)
+def _mock_fight_result(team1: str, team2: str) -> FightResult:
+    """
+    Deterministic mock result for a matchup.
+
+    The outcome depends only on the two names, so results are memoized;
+    FightResult is frozen, which makes sharing one instance between callers safe.
+    """
+    # Order the pair case-insensitively so argument order doesn't matter.
+    # crc32 (unlike hash()) is stable across processes and PYTHONHASHSEED.
+    lower1, lower2 = team1.lower(), team2.lower()
+    if lower1 < lower2 or (lower1 == lower2 and team1 <= team2):
+        first, second, seed_string = team1, team2, f"{lower1}\x00{lower2}"
+    else:
+        first, second, seed_string = team2, team1, f"{lower2}\x00{lower1}"
+    rng = random.Random(zlib.crc32(seed_string.encode()))
+
+    winner, loser = rng.choice([(first, second), (second, first)])
+    probability = rng.randint(54, 95)
+
+    template = rng.choice(MOCK_NARRATIVES)
+    narrative = template.format(winner=winner, loser=loser)
+
+    return FightResult(
+        winner=winner,
+        loser=loser,
+        win_probability=probability,
+        narrative=narrative,
+    )
 
 
 class FightSimulator:
 
-    def __init__(self, mock_mode: bool = False) -> None:
+    def __init__(
+        self,
+        mock_mode: bool = False,
+        client=None,
+        cache_path: str = DEFAULT_CACHE_PATH,
+        rate_limiter: RateLimiter = None,
+    ) -> None:
         """
         Initialize the simulator.
 
-        Automatically switches to mock mode if ANTHROPIC_API_KEY is not set.
+        Automatically switches to mock mode if ANTHROPIC_API_KEY is not set
+        and no client is supplied.
 
         Args:
             mock_mode: Force mock mode even if API key is present.
+            client: Pre-built AsyncAnthropic-compatible client to use instead of
+                constructing one from ANTHROPIC_API_KEY (mainly for tests).
+            cache_path: On-disk cache of Claude fight results, so re-running a
+                matchup does not call the API again. None disables caching.
+                Unused in mock mode, which is already deterministic.
+            rate_limiter: Limits applied to individual Claude calls. Defaults to
+                a RateLimiter with Anthropic Tier 1 limits. Batches bypass it.
         """
-        self.mock_mode = mock_mode or not os.environ.get("ANTHROPIC_API_KEY")
+        self.mock_mode = mock_mode or (
+            client is None and not os.environ.get("ANTHROPIC_API_KEY")
+        )
         self._client = None
+        self._http_client = None  # Only set when we own the connection pool
+        self._cache = None
+        self._rate_limiter = None
+        self._loop = None  # Event loop behind the blocking wrappers, created on first use
         if not self.mock_mode:
-            from anthropic import Anthropic
+            self._client = client if client is not None else self._create_client()
+            self._rate_limiter = rate_limiter or RateLimiter()
+            if cache_path is not None:
+                Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+                self._cache = shelve.open(cache_path)
+
+    def _create_client(self):
+        """
+        Construct the AsyncAnthropic client from ANTHROPIC_API_KEY.
+
+        The client gets its own HTTP/2 connection pool, kept for the lifetime of
+        the simulator so every fight reuses warm connections instead of paying
+        a fresh TLS handshake.
+        """
+        anthropic = _anthropic()
+        self._http_client = anthropic.DefaultAsyncHttpxClient(http2=True)
+        return anthropic.AsyncAnthropic(
+            api_key=os.environ["ANTHROPIC_API_KEY"],
+            http_client=self._http_client,
+            timeout=anthropic.Timeout(HTTP_TIMEOUT_SECONDS, connect=HTTP_CONNECT_TIMEOUT_SECONDS),
+        )
+
+    async def __aenter__(self) -> "FightSimulator":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the result cache and the HTTP connection pool, if this simulator created one."""
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    def close_sync(self) -> None:
+        """Blocking counterpart of close() for callers that used the blocking wrappers."""
+        if self._loop is None:
+            asyncio.run(self.close())
+            return
+        self._loop.run_until_complete(self.close())
+        self._loop.close()
+        self._loop = None
+
+    def _run_sync(self, coro):
+        """
+        Run a coroutine to completion on the simulator's own event loop.
 
-            self._client = Anthropic(api_key=os.environ["ANTHROPIC_API_KEY"])
+        Pooled connections belong to the loop that opened them, so every
+        blocking call reuses one loop instead of asyncio.run's fresh one.
+        """
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+
+    async def warm_up(self) -> None:
+        """
+        Open a connection to the API before the first fight.
+
+        Fetching the model's metadata is a cheap request that gets the TCP and
+        TLS handshakes out of the way. Does nothing in mock mode.
+        """
+        if self.mock_mode:
+            return
+        await self._client.models.retrieve(CLAUDE_MODEL)
 
-    def simulate_fight(self, team1: str, team2: str) -> FightResult:
+    def simulate_fight(
+        self, team1: str, team2: str, no_cache: bool = False
+    ) -> FightResult:
         """
         Simulate a mascot fight between two teams.
 
+        Blocking wrapper around simulate_fight_async for callers that are not
+        already running inside an event loop. Real-mode calls share one event
+        loop owned by the simulator; call close_sync() when finished.
+
         Args:
             team1: Name of the first team.
             team2: Name of the second team.
+            no_cache: Ignore any cached result and ask Claude again.
 
         Returns:
             FightResult with winner, loser, probability, and narrative.
         """
         if self.mock_mode:
             return self._mock_fight(team1, team2)
-        return self._claude_fight(team1, team2)
+        return self._run_sync(self.simulate_fight_async(team1, team2, no_cache))
 
-    def _mock_fight(self, team1: str, team2: str) -> FightResult:
-        """Return a deterministic mock result based on the team names."""
-        # Sort names to ensure same result regardless of argument order
-        seed_string = "".join(sorted([team1.lower(), team2.lower()]))
-        rng = random.Random(abs(hash(seed_string)) % (2**32))
+    async def simulate_fight_async(
+        self, team1: str, team2: str, no_cache: bool = False
+    ) -> FightResult:
+        """
+        Simulate a mascot fight between two teams without blocking the event loop.
+
+        Args:
+            team1: Name of the first team.
+            team2: Name of the second team.
+            no_cache: Ignore any cached result and ask Claude again. The new
+                result still replaces the cached one.
+
+        Returns:
+            FightResult with winner, loser, probability, and narrative.
+        """
+        if self.mock_mode:
+            return self._mock_fight(team1, team2)
+        if not no_cache:
+            cached = self._cache_lookup(team1, team2)
+            if cached is not None:
+                return cached
+        result = await self._claude_fight(team1, team2)
+        self._cache_store(result)
+        return result
+
+    def simulate_batch(self, pairs: list, no_cache: bool = False) -> list:
+        """Blocking wrapper around simulate_batch_async."""
+        if self.mock_mode:
+            return [self._mock_fight(team1, team2) for team1, team2 in pairs]
+        return self._run_sync(self.simulate_batch_async(pairs, no_cache))
+
+    async def simulate_batch_async(self, pairs: list, no_cache: bool = False) -> list:
+        """
+        Simulate many independent fights as one Message Batches API submission.
+
+        Batched requests are billed at about half price, but a batch can take
+        minutes to finish, so this trades latency for cost. Matchups already in
+        the cache are answered from it and left out of the batch.
+
+        Args:
+            pairs: List of (team1, team2) name tuples.
+            no_cache: Ignore cached results and send every matchup.
+
+        Returns:
+            List of FightResult in the same order as pairs.
 
-        # Choose from sorted list so result is identical regardless of argument order
-        sorted_teams = sorted([team1, team2])
-        winner = rng.choice(sorted_teams)
-        loser = sorted_teams[1] if winner == sorted_teams[0] else sorted_teams[0]
-        probability = rng.randint(54, 95)
+        Raises:
+            ValueError: If any request in the batch did not succeed, returned
+                an unparseable response, or is missing from the results. Raised
+                only after every successful result has been cached, and lists
+                all the failed custom_ids.
+        """
+        if self.mock_mode:
+            return [self._mock_fight(team1, team2) for team1, team2 in pairs]
+
+        results = [
+            None if no_cache else self._cache_lookup(team1, team2)
+            for team1, team2 in pairs
+        ]
+        pending = [i for i, result in enumerate(results) if result is None]
+        if not pending:
+            return results
+
+        batch = await self._client.messages.batches.create(
+            requests=[
+                {
+                    "custom_id": str(i),
+                    "params": {**self._message_params(*pairs[i]), **_SAMPLING_PARAMS},
+                }
+                for i in pending
+            ]
+        )
+        while batch.processing_status != "ended":
+            await asyncio.sleep(BATCH_POLL_INTERVAL_SECONDS)
+            batch = await self._client.messages.batches.retrieve(batch.id)
+
+        # Parse and cache every successful entry before reporting any failure,
+        # so results that were already paid for are kept
+        failures = {}  # index -> reason
+        async for entry in await self._client.messages.batches.results(batch.id):
+            i = int(entry.custom_id)
+            team1, team2 = pairs[i]
+            if entry.result.type != "succeeded":
+                failures[i] = entry.result.type
+                continue
+            raw_text = entry.result.message.content[0].text
+            try:
+                results[i] = self._parse_claude_response(raw_text, team1, team2)
+            except ValueError as e:
+                failures[i] = f"unparseable response: {e}"
+                continue
+            self._cache_store(results[i])
+
+        unresolved = [i for i in pending if results[i] is None]
+        if unresolved:
+            details = "\n".join(
+                f"  {i}: {pairs[i][0]!r} vs {pairs[i][1]!r} - "
+                f"{failures.get(i, 'missing from batch results')}"
+                for i in unresolved
+            )
+            raise ValueError(
+                f"{len(unresolved)} batch request(s) did not succeed "
+                f"(custom_id: matchup - reason):\n{details}"
+            )
+        return results
 
-        template = rng.choice(MOCK_NARRATIVES)
-        narrative = template.format(winner=winner, loser=loser)
+    @staticmethod
+    def _cache_key(team1: str, team2: str) -> str:
+        """
+        Cache key for a matchup; the same regardless of argument order or case.
 
+        The key also covers the model, prompts and sampling settings, so changing
+        any of them stops old results from being served.
+        """
+        settings = _settings_digest(
+            CLAUDE_MODEL,
+            CLAUDE_SYSTEM_PROMPT,
+            CLAUDE_PROMPT_TEMPLATE,
+            CLAUDE_MAX_TOKENS,
+            CLAUDE_TEMPERATURE,
+        )
+        pair = "|".join(sorted([team1.lower(), team2.lower()]))
+        return hashlib.blake2b(f"{settings}|{pair}".encode(), digest_size=16).hexdigest()
+
+    def _cache_lookup(self, team1: str, team2: str):
+        """Return the cached FightResult for this matchup, or None on a miss."""
+        if self._cache is None:
+            return None
+        entry = self._cache.get(self._cache_key(team1, team2))
+        if entry is None:
+            return None
+        # Re-map onto the names as passed in, which may differ in case or order
+        if entry["winner"].lower() == team1.lower():
+            winner, loser = team1, team2
+        else:
+            winner, loser = team2, team1
         return FightResult(
             winner=winner,
             loser=loser,
-            win_probability=probability,
-            narrative=narrative,
+            win_probability=entry["win_probability"],
+            narrative=entry["narrative"],
         )
 
-    def _claude_fight(self, team1: str, team2: str) -> FightResult:
-        """Call the Claude API and parse the JSON response."""
-        prompt = CLAUDE_PROMPT_TEMPLATE.format(team1=team1, team2=team2)
-        response = self._client.messages.create(
-            model=CLAUDE_MODEL,
-            max_tokens=500,
-            messages=[{"role": "user", "content": prompt}],
-        )
-        raw_text = response.content[0].text
+    def _cache_store(self, result: FightResult) -> None:
+        """Save a Claude result so later runs can reuse it."""
+        if self._cache is None:
+            return
+        self._cache[self._cache_key(result.winner, result.loser)] = dataclasses.asdict(result)
+
+    def _mock_fight(self, team1: str, team2: str) -> FightResult:
+        """Return a deterministic mock result based on the team names."""
+        return _mock_fight_result(team1, team2)
+
+    def _message_params(self, team1: str, team2: str) -> dict:
+        """Build the messages.stream / messages.create keyword arguments for one fight."""
+        prompt = f"{_PROMPT_PREFIX}{team1}{_PROMPT_MIDDLE}{team2}{_PROMPT_SUFFIX}"
+        return {
+            "model": CLAUDE_MODEL,
+            "max_tokens": CLAUDE_MAX_TOKENS,
+            "system": [
+                {
+                    "type": "text",
+                    "text": CLAUDE_SYSTEM_PROMPT,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ],
+            "messages": [{"role": "user", "content": prompt}],
+        }
+
+    async def _claude_fight(self, team1: str, team2: str) -> FightResult:
+        """
+        Stream a fight from the Claude API, within the rate limits, and parse
+        the JSON response.
+
+        Transient failures (connection errors, 408/429, 5xx) are retried up to
+        MAX_API_ATTEMPTS times with jittered exponential backoff starting at
+        INITIAL_BACKOFF_SECONDS. Anything else is raised immediately.
+        """
+        params = self._message_params(team1, team2)
+        prompt_chars = len(CLAUDE_SYSTEM_PROMPT) + len(params["messages"][0]["content"])
+        estimated_tokens = prompt_chars // CHARS_PER_TOKEN
+        # The loop below does its own retries with a faster first backoff, so the
+        # SDK's are turned off for this call only; batch and warm-up calls keep them
+        messages = self._client.with_options(max_retries=0).messages
+
+        for attempt in range(MAX_API_ATTEMPTS):
+            await self._rate_limiter.acquire(estimated_tokens)
+            try:
+                async with messages.stream(
+                    **params, extra_body=_SAMPLING_PARAMS
+                ) as stream:
+                    raw_text = "".join([text async for text in stream.text_stream])
+                break
+            except Exception as e:
+                if attempt == MAX_API_ATTEMPTS - 1 or not self._is_retryable(e):
+                    raise
+            await asyncio.sleep(
+                INITIAL_BACKOFF_SECONDS * 2**attempt
+                + random.uniform(0, BACKOFF_JITTER_SECONDS)
+            )
+
         return self._parse_claude_response(raw_text, team1, team2)
 
-    def _parse_claude_response(
-        self, raw_text: str, team1: str, team2: str
-    ) -> FightResult:
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        """Whether an API error is transient and the request worth repeating."""
+        try:
+            anthropic = _anthropic()
+        except ImportError:
+            return False  # A client that isn't the SDK can't raise the SDK's transient errors
+        if isinstance(error, anthropic.APIConnectionError):  # Includes timeouts
+            return True
+        if isinstance(error, anthropic.APIStatusError):
+            return error.status_code in (408, 429) or error.status_code >= 500
+        return False
+
+    @staticmethod
+    def _parse_claude_response(raw_text: str, team1: str, team2: str) -> FightResult:
         """
         Parse Claude's JSON response into a FightResult.
 
@@ -137,31 +505,15 @@ class FightSimulator:
         Raises:
             ValueError: If JSON is malformed or winner is not one of the two teams.
         """
-        # Extract the first balanced {...} JSON object from the response.
+        # Decode the first JSON object in the response, ignoring anything after it.
         # This handles code fences, extra trailing braces, and surrounding text.
         start = raw_text.find("{")
         if start == -1:
             raise ValueError(
                 f"Claude returned no JSON object.\nRaw response: {raw_text!r}"
             )
-        depth = 0
-        end = start
-        for i, ch in enumerate(raw_text[start:], start):
-            if ch == "{":
-                depth += 1
-            elif ch == "}":
-                depth -= 1
-                if depth == 0:
-                    end = i
-                    break
-        else:
-            raise ValueError(
-                f"Claude returned unbalanced JSON.\nRaw response: {raw_text!r}"
-            )
-        json_str = raw_text[start : end + 1]
-
         try:
-            data = json.loads(json_str)
+            data, _ = _JSON_DECODER.raw_decode(raw_text, start)
         except json.JSONDecodeError as e:
             raise ValueError(
                 f"Claude returned invalid JSON: {e}\nRaw response: {raw_text!r}"
@@ -172,21 +524,18 @@ class FightSimulator:
         narrative = data.get("narrative", "")
 
         # Validate winner is one of the two teams (case-insensitive)
-        if raw_winner.lower() == team1.lower():
+        winner_lower, team1_lower, team2_lower = (
+            raw_winner.lower(), team1.lower(), team2.lower()
+        )
+        if winner_lower == team1_lower:
             winner, loser = team1, team2
-        elif raw_winner.lower() == team2.lower():
+        elif winner_lower == team2_lower:
             winner, loser = team2, team1
         else:
             # Try substring matching as fallback
-            if (
-                team1.lower() in raw_winner.lower()
-                or raw_winner.lower() in team1.lower()
-            ):
+            if team1_lower in winner_lower or winner_lower in team1_lower:
                 winner, loser = team1, team2
-            elif (
-                team2.lower() in raw_winner.lower()
-                or raw_winner.lower() in team2.lower()
-            ):
+            elif team2_lower in winner_lower or winner_lower in team2_lower:
                 winner, loser = team2, team1
             else:
                 raise ValueError(
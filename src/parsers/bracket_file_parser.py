@@ -1,3 +1,5 @@
+from pathlib import Path
+
 from src.parsers.base_parser import BaseBracketParser
 from src.bracket import Bracket, Division, Team
 
@@ -6,7 +8,6 @@ class BracketFileParser(BaseBracketParser):
 
     DIVISION_SIZE = 17       # 1 title line + 16 team lines
     TEAMS_PER_DIVISION = 16
-    EXPECTED_DIVISIONS = 4
     EXPECTED_TOTAL_LINES = 68  # 4 * 17
 
     def parse(self, source: str) -> Bracket:
@@ -30,25 +31,26 @@ class BracketFileParser(BaseBracketParser):
         lines = self._read_lines(source)
         self._validate_line_count(lines)
 
+        # Each division block: lines[offset] is the title, the next 16 are teams
         divisions = {}
-        for i in range(self.EXPECTED_DIVISIONS):
-            offset = i * self.DIVISION_SIZE
-            title, teams = self._parse_division(lines, offset)
-            divisions[title] = Division(name=title, teams=teams)
+        for offset in range(0, self.EXPECTED_TOTAL_LINES, self.DIVISION_SIZE):
+            title = lines[offset].title()
+            divisions[title] = Division(
+                name=title,
+                teams=[
+                    Team(name=name, seed=seed)
+                    for seed, name in enumerate(
+                        lines[offset + 1 : offset + 1 + self.TEAMS_PER_DIVISION], start=1
+                    )
+                ],
+            )
 
         return Bracket(divisions=divisions)
 
     def _read_lines(self, filepath: str) -> list:
         """Read file, strip whitespace, filter blank lines."""
-        with open(filepath, "r", encoding="utf-8-sig") as f:
-            raw_lines = f.readlines()
-
-        lines = []
-        for line in raw_lines:
-            stripped = line.strip()
-            if stripped:
-                lines.append(stripped)
-        return lines
+        text = Path(filepath).read_text(encoding="utf-8-sig")
+        return [stripped for stripped in (line.strip() for line in text.splitlines()) if stripped]
 
     def _validate_line_count(self, lines: list) -> None:
         """Raise ValueError if not exactly 68 non-blank lines."""
@@ -58,21 +60,3 @@ class BracketFileParser(BaseBracketParser):
                 f"got {len(lines)}. File must have 4 divisions of 17 lines each "
                 f"(1 division title + 16 team names)."
             )
-
-    def _parse_division(self, lines: list, offset: int) -> tuple:
-        """
-        Extract division title and 16 team names from lines[offset:offset+17].
-
-        Args:
-            lines: Full list of stripped non-blank lines.
-            offset: Starting index for this division.
-
-        Returns:
-            (division_title, [team1, team2, ..., team16])
-        """
-        title = lines[offset].strip().title()
-        teams = [
-            Team(name=lines[offset + 1 + i], seed=i + 1)
-            for i in range(self.TEAMS_PER_DIVISION)
-        ]
-        return title, teams
@@ -0,0 +1,74 @@
+import asyncio
+from time import monotonic
+
+# Anthropic Tier 1 defaults
+DEFAULT_REQUESTS_PER_MINUTE = 40
+DEFAULT_TOKENS_PER_MINUTE = 16_000
+
+
+class RateLimiter:
+    """
+    Keeps API calls under per-minute request and input-token limits.
+
+    Requests and input tokens each have a bucket that holds up to one minute's
+    allowance and refills continuously at limit / 60 per second. Call acquire()
+    before each request. How many calls are in flight at once is left to the
+    caller (Tournament's max_concurrent).
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int = DEFAULT_REQUESTS_PER_MINUTE,
+        tokens_per_minute: int = DEFAULT_TOKENS_PER_MINUTE,
+    ) -> None:
+        """
+        Args:
+            requests_per_minute: Maximum requests started per rolling minute.
+            tokens_per_minute: Maximum estimated input tokens per rolling minute.
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._lock = asyncio.Lock()  # Serializes waiters so they are served in order
+        self._request_budget = float(requests_per_minute)
+        self._token_budget = float(tokens_per_minute)
+        self._last_refill = monotonic()
+
+    async def acquire(self, estimated_input_tokens: int = 0) -> None:
+        """
+        Wait until one more request fits under every limit, then claim it.
+
+        Args:
+            estimated_input_tokens: Expected input size of the request. Values
+                above tokens_per_minute are clamped so a single large request
+                cannot wait forever.
+        """
+        tokens = min(estimated_input_tokens, self.tokens_per_minute)
+        async with self._lock:
+            self._refill()
+            wait = self._seconds_until_available(tokens)
+            while wait > 0:
+                await asyncio.sleep(wait)
+                self._refill()
+                wait = self._seconds_until_available(tokens)
+            self._request_budget -= 1
+            self._token_budget -= tokens
+
+    def _refill(self) -> None:
+        """Top up both buckets for the time elapsed since the last refill."""
+        now = monotonic()
+        elapsed_minutes = (now - self._last_refill) / 60
+        self._last_refill = now
+        self._request_budget = min(
+            self.requests_per_minute,
+            self._request_budget + elapsed_minutes * self.requests_per_minute,
+        )
+        self._token_budget = min(
+            self.tokens_per_minute,
+            self._token_budget + elapsed_minutes * self.tokens_per_minute,
+        )
+
+    def _seconds_until_available(self, tokens: int) -> float:
+        """Seconds until both buckets can cover one request of the given size."""
+        request_wait = (1 - self._request_budget) * 60 / self.requests_per_minute
+        token_wait = (tokens - self._token_budget) * 60 / self.tokens_per_minute
+        return max(request_wait, token_wait, 0.0)
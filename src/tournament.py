@@ -1,3 +1,5 @@
+import asyncio
+import io
 from pathlib import Path
 
 from src.bracket import Bracket
@@ -6,6 +8,7 @@ from src.fight_simulator import FightSimulator
 
 DIVISION_ROUND_NAMES = ["Round of 64", "Round of 32", "Sweet 16", "Elite 8"]
 DIVISION_ORDER = ["West", "East", "South", "Midwest"]
+DEFAULT_MAX_CONCURRENT_FIGHTS = 16
 
 
 class Tournament:
@@ -15,102 +18,244 @@ class Tournament:
         bracket: Bracket,
         simulator: FightSimulator,
         output_file: str = "output/run1.txt",  # caller should pass a timestamped path
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT_FIGHTS,
+        use_batch_api: bool = False,
     ) -> None:
         """
         Args:
             bracket: Populated Bracket instance.
             simulator: FightSimulator to use for each matchup.
             output_file: Path to write results. Parent dirs created if needed.
+            max_concurrent: Maximum number of fights in flight at once.
+            use_batch_api: Submit each round as one Message Batches API request
+                (about half the cost, but each round may take minutes).
         """
         self.bracket = bracket
         self.simulator = simulator
         self.output_file = output_file
-        self._results: list = []  # Buffer for output lines
+        self.max_concurrent = max_concurrent
+        self.use_batch_api = use_batch_api
+        self._results = io.StringIO()  # Buffer for output lines
+        self._fight_slots = None  # asyncio.Semaphore, created per run inside the event loop
 
     def run(self) -> None:
+        """
+        Blocking wrapper around run_async for callers outside an event loop.
+
+        The simulator's connections belong to the event loop this call
+        creates, so the simulator is closed before that loop ends. To keep
+        using it, await run_async inside `async with simulator` instead.
+        """
+        asyncio.run(self._run_and_close())
+
+    async def _run_and_close(self) -> None:
+        try:
+            await self.run_async()
+        finally:
+            await self.simulator.close()
+
+    async def run_async(self) -> None:
         """
         Execute the full tournament end-to-end and write the output file.
 
         Sequence:
-          1. Round of 64, Round of 32, Sweet 16, Elite 8 (per division)
+          1. Round of 64, Round of 32, Sweet 16, Elite 8 (divisions in parallel)
           2. Final Four (2 semifinal games)
           3. Championship (1 game)
           4. Write output file
         """
+        self._fight_slots = asyncio.Semaphore(self.max_concurrent)
+
         self._record("=" * 60)
         self._record("       MASCOT MADNESS TOURNAMENT - FULL RESULTS")
         self._record("=" * 60)
 
-        region_winners = self._run_division_rounds()
+        if self.use_batch_api:
+            region_winners = await self._run_division_rounds_batched()
+        else:
+            region_winners = await self._run_division_rounds()
 
-        self._run_final_four_and_championship(region_winners)
+        await self._run_final_four_and_championship(region_winners)
 
         self._write_output()
 
-    def _run_division_rounds(self) -> dict:
+    async def _run_division_rounds(self) -> dict:
         """
         Run Rounds of 64, 32, Sweet 16, and Elite 8 for all four divisions.
 
+        Divisions are independent until the Final Four, so they run concurrently.
+        Each division writes to its own buffer; the buffers are appended to the
+        output in DIVISION_ORDER once every division has finished.
+
         Returns:
             {"West": Team, "East": Team, "South": Team, "Midwest": Team}
         """
+        division_names = [
+            name for name in DIVISION_ORDER if name in self.bracket.divisions
+        ]
+        outcomes = await asyncio.gather(
+            *[self._run_one_division(name) for name in division_names]
+        )
+
         region_winners = {}
+        for division_name, (champion, buffer) in zip(division_names, outcomes):
+            self._results.write(buffer.getvalue())
+            region_winners[division_name] = champion
 
-        for division_name in DIVISION_ORDER:
-            if division_name not in self.bracket.divisions:
-                continue
+        return region_winners
 
-            self._record("")
-            self._record("-" * 60)
-            self._record(f"{division_name.upper()} DIVISION")
-            self._record("-" * 60)
-
-            teams_count = len(self.bracket.divisions[division_name].teams)
-            round_idx = 0
-
-            while teams_count > 1:
-                round_name = (
-                    DIVISION_ROUND_NAMES[round_idx]
-                    if round_idx < len(DIVISION_ROUND_NAMES)
-                    else f"Round of {teams_count}"
+    async def _run_one_division(self, division_name: str) -> tuple:
+        """
+        Play one division down to its champion.
+
+        Returns:
+            (champion_Team, StringIO holding this division's output)
+        """
+        buffer = io.StringIO()
+        self._record_division_header(division_name, buffer)
+
+        teams_count = len(self.bracket.divisions[division_name].teams)
+        round_idx = 0
+
+        while teams_count > 1:
+            round_name = self._round_name(round_idx, teams_count)
+            print('Starting round:', round_name, 'for division:', division_name)
+            winners = await self._run_single_division_round(
+                division_name, round_name, buffer
+            )
+            self.bracket.advance_round(division_name, winners)
+            teams_count = len(winners)
+            round_idx += 1
+
+        champion = self._record_division_champion(division_name, buffer)
+        return champion, buffer
+
+    async def _run_single_division_round(
+        self, division_name: str, round_name: str, buffer: io.StringIO
+    ) -> list:
+        """
+        Simulate all games in one round for one division.
+
+        The games in a round are independent, so they are sent to the simulator
+        concurrently; results come back in matchup order.
+
+        Returns:
+            List of winning Team objects in matchup order.
+        """
+        matchups = self.bracket.get_division_matchups(division_name)
+        results = await asyncio.gather(
+            *[self._simulate(team1.name, team2.name) for team1, team2 in matchups]
+        )
+        return self._record_round(round_name, matchups, results, buffer)
+
+    async def _run_division_rounds_batched(self) -> dict:
+        """
+        Batch-API variant of _run_division_rounds.
+
+        All divisions play the same round together, and each round across every
+        division is submitted as one batch (32, 16, 8, then 4 fights).
+
+        Returns:
+            {"West": Team, "East": Team, "South": Team, "Midwest": Team}
+        """
+        division_names = [
+            name for name in DIVISION_ORDER if name in self.bracket.divisions
+        ]
+        buffers = {name: io.StringIO() for name in division_names}
+        for division_name in division_names:
+            self._record_division_header(division_name, buffers[division_name])
+
+        round_idx = 0
+        active = [
+            name for name in division_names
+            if len(self.bracket.divisions[name].teams) > 1
+        ]
+        while active:
+            matchups = {
+                name: self.bracket.get_division_matchups(name) for name in active
+            }
+            pairs = [
+                (team1.name, team2.name)
+                for name in active
+                for team1, team2 in matchups[name]
+            ]
+            print('Starting batch of', len(pairs), 'fights for round', round_idx + 1)
+            results = iter(await self.simulator.simulate_batch_async(pairs))
+
+            for division_name in active:
+                teams_count = len(self.bracket.divisions[division_name].teams)
+                round_name = self._round_name(round_idx, teams_count)
+                division_results = [next(results) for _ in matchups[division_name]]
+                winners = self._record_round(
+                    round_name,
+                    matchups[division_name],
+                    division_results,
+                    buffers[division_name],
                 )
-                print('Starting round:', round_name, 'for division:', division_name)
-                winners = self._run_single_division_round(division_name, round_name)
                 self.bracket.advance_round(division_name, winners)
-                teams_count = len(winners)
-                round_idx += 1
 
-            champion = self.bracket.divisions[division_name].teams[0]
-            region_winners[division_name] = champion
-            self._record("")
-            self._record(f"  *** {division_name.upper()} CHAMPION: {champion.name.upper()} ***", should_print=True)
+            round_idx += 1
+            active = [
+                name for name in active
+                if len(self.bracket.divisions[name].teams) > 1
+            ]
+
+        region_winners = {}
+        for division_name in division_names:
+            buffer = buffers[division_name]
+            region_winners[division_name] = self._record_division_champion(
+                division_name, buffer
+            )
+            self._results.write(buffer.getvalue())
 
         return region_winners
 
-    def _run_single_division_round(
-        self, division_name: str, round_name: str
+    @staticmethod
+    def _round_name(round_idx: int, teams_count: int) -> str:
+        """Display name for a division round, e.g. "Sweet 16"."""
+        if round_idx < len(DIVISION_ROUND_NAMES):
+            return DIVISION_ROUND_NAMES[round_idx]
+        return f"Round of {teams_count}"
+
+    def _record_division_header(self, division_name: str, buffer: io.StringIO) -> None:
+        """Append the banner that opens a division's section."""
+        self._record("", buffer=buffer)
+        self._record("-" * 60, buffer=buffer)
+        self._record(f"{division_name.upper()} DIVISION", buffer=buffer)
+        self._record("-" * 60, buffer=buffer)
+
+    def _record_division_champion(self, division_name: str, buffer: io.StringIO):
+        """Append the champion line for a finished division and return the champion Team."""
+        champion = self.bracket.divisions[division_name].teams[0]
+        self._record("", buffer=buffer)
+        self._record(f"  *** {division_name.upper()} CHAMPION: {champion.name.upper()} ***", should_print=True, buffer=buffer)
+        return champion
+
+    def _record_round(
+        self, round_name: str, matchups: list, results: list, buffer: io.StringIO
     ) -> list:
         """
-        Simulate all games in one round for one division.
+        Append one round's games to buffer.
+
+        Args:
+            matchups: List of (Team, Team) tuples.
+            results: FightResult for each matchup, in the same order.
 
         Returns:
             List of winning Team objects in matchup order.
         """
-        matchups = self.bracket.get_division_matchups(division_name)
-        self._record("")
-        self._record(f"  --- {round_name} ---")
+        self._record("", buffer=buffer)
+        self._record(f"  --- {round_name} ---", buffer=buffer)
 
         winners = []
-        for i, (team1, team2) in enumerate(matchups, start=1):
-            result = self.simulator.simulate_fight(team1.name, team2.name)
-            self._format_game(i, team1.name, team2.name, result)
-            winner = team1 if result.winner == team1.name else team2
-            winners.append(winner)
+        for i, ((team1, team2), result) in enumerate(zip(matchups, results), start=1):
+            self._format_game(i, team1.name, team2.name, result, buffer)
+            winners.append(self._winning_team(team1, team2, result))
 
         return winners
 
-    def _run_final_four_and_championship(self, region_winners: dict) -> None:
-        """Run the Final Four and Championship games."""
+    async def _run_final_four_and_championship(self, region_winners: dict) -> None:
+        """Run the Final Four (both semifinals at once) and then the Championship."""
         self._record("")
         self._record("=" * 60)
         self._record("FINAL FOUR")
@@ -120,14 +265,22 @@ class Tournament:
         semifinal_labels = ["West vs East", "South vs Midwest"]
         final_four_winners = []
 
-        for i, (team1, team2) in enumerate(matchups):
+        if self.use_batch_api:
+            results = await self.simulator.simulate_batch_async(
+                [(team1.name, team2.name) for team1, team2 in matchups]
+            )
+        else:
+            # The two semifinals are independent, so play them at the same time
+            results = await asyncio.gather(
+                *[self._simulate(team1.name, team2.name) for team1, team2 in matchups]
+            )
+
+        for i, ((team1, team2), result) in enumerate(zip(matchups, results)):
             label = semifinal_labels[i] if i < len(semifinal_labels) else f"Semifinal {i + 1}"
             self._record("")
             self._record(f"  --- Semifinal {i + 1}: {label} ---")
-            result = self.simulator.simulate_fight(team1.name, team2.name)
             self._format_game(1, team1.name, team2.name, result)
-            winner = team1 if result.winner == team1.name else team2
-            final_four_winners.append(winner)
+            final_four_winners.append(self._winning_team(team1, team2, result))
 
         # Championship
         finalist1, finalist2 = self.bracket.get_championship_matchup(final_four_winners)
@@ -138,7 +291,7 @@ class Tournament:
         self._record("=" * 60)
         self._record("")
 
-        result = self.simulator.simulate_fight(finalist1.name, finalist2.name)
+        result = await self._simulate(finalist1.name, finalist2.name)
         self._format_game(1, finalist1.name, finalist2.name, result)
 
         self._record("")
@@ -146,21 +299,52 @@ class Tournament:
         self._record(f"     MASCOT MADNESS CHAMPION: {result.winner.upper()}")
         self._record("=" * 60)
 
+    @staticmethod
+    def _winning_team(team1, team2, result: FightResult):
+        """
+        Return whichever of the two Teams the result names as the winner.
+
+        Raises:
+            ValueError: If the result's winner matches neither team name exactly.
+        """
+        teams = {team1.name: team1, team2.name: team2}
+        if result.winner not in teams:
+            raise ValueError(
+                f"Fight winner {result.winner!r} is neither {team1.name!r} "
+                f"nor {team2.name!r}"
+            )
+        return teams[result.winner]
+
+    async def _simulate(self, team1: str, team2: str) -> FightResult:
+        """Run one fight while holding one of the max_concurrent fight slots."""
+        async with self._fight_slots:
+            return await self.simulator.simulate_fight_async(team1, team2)
+
     def _format_game(
-        self, game_num: int, team1: str, team2: str, result: FightResult
+        self,
+        game_num: int,
+        team1: str,
+        team2: str,
+        result: FightResult,
+        buffer: io.StringIO = None,
     ) -> None:
         """Append a formatted game result to the output buffer."""
-        self._record("")
-        self._record(f"  Game {game_num}: {team1} vs {team2}")
+        self._record("", buffer=buffer)
+        self._record(f"  Game {game_num}: {team1} vs {team2}", buffer=buffer)
         self._record(
-            f"  WINNER: {result.winner} (Win probability: {result.win_probability}%)"
+            f"  WINNER: {result.winner} (Win probability: {result.win_probability}%)",
+            buffer=buffer,
         )
         # Wrap narrative with quotes, indented
-        self._record(f'  "{result.narrative}"')
+        self._record(f'  "{result.narrative}"', buffer=buffer)
 
-    def _record(self, line: str, should_print: bool = False) -> None:
-        """Append a line to the in-memory results buffer."""
-        self._results.append(line)
+    def _record(
+        self, line: str, should_print: bool = False, buffer: io.StringIO = None
+    ) -> None:
+        """Write a line to buffer, or to the main results buffer if none is given."""
+        out = self._results if buffer is None else buffer
+        out.write(line)
+        out.write("\n")
         if should_print:
             print(line)
 
@@ -169,5 +353,4 @@ class Tournament:
         output_path = Path(self.output_file)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         with open(output_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(self._results))
-            f.write("\n")
+            f.write(self._results.getvalue())
@@ -1,7 +1,59 @@
 import pytest
 
+from src.bracket import Bracket, Division, Team
+from src.fight_simulator import FightSimulator
+
+DIVISION_NAMES = ("West", "East", "South", "Midwest")
+
 
 @pytest.fixture(autouse=True)
 def remove_api_key(monkeypatch):
     """Ensure ANTHROPIC_API_KEY is never set during tests unless explicitly re-added."""
     monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+
+
+@pytest.fixture(scope="session")
+def _base_teams():
+    """Teams named 'Div_Team_N' (seed N) for all 4 divisions, built once per session."""
+    return {
+        div_name: tuple(Team(name=f"{div_name}_Team_{i}", seed=i) for i in range(1, 17))
+        for div_name in DIVISION_NAMES
+    }
+
+
+@pytest.fixture(scope="session")
+def make_bracket(_base_teams):
+    """Factory for new Brackets over the shared (immutable) Teams; only team lists are copied."""
+    def _make() -> Bracket:
+        return Bracket(divisions={
+            div_name: Division(name=div_name, teams=list(teams))
+            for div_name, teams in _base_teams.items()
+        })
+    return _make
+
+
+@pytest.fixture
+def fresh_bracket(make_bracket):
+    """A Bracket of its own for tests that mutate it (e.g. via advance_round)."""
+    return make_bracket()
+
+
+@pytest.fixture(scope="class")
+def shared_bracket(make_bracket):
+    """One Bracket shared by every test in a class; tests must not mutate it."""
+    return make_bracket()
+
+
+@pytest.fixture
+def make_simulator():
+    """Factory for FightSimulators that are closed (event loop, cache, pool) at teardown."""
+    simulators = []
+
+    def _make(**kwargs) -> FightSimulator:
+        simulator = FightSimulator(**kwargs)
+        simulators.append(simulator)
+        return simulator
+
+    yield _make
+    for simulator in simulators:
+        simulator.close_sync()
@@ -0,0 +1,131 @@
+import json
+from types import SimpleNamespace
+
+from src.rate_limiter import RateLimiter
+
+
+def claude_message(text: str) -> SimpleNamespace:
+    """Shape of an Anthropic Message as far as FightSimulator reads it."""
+    return SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+
+def fighters(params: dict) -> tuple:
+    """Pull (team1, team2) back out of a messages.create request."""
+    prompt = params["messages"][0]["content"]
+    team1 = prompt.split("FIGHTER 1: ")[1].split("\n")[0]
+    team2 = prompt.split("FIGHTER 2: ")[1].split("\n")[0]
+    return team1, team2
+
+
+def second_team_wins(team1: str, team2: str) -> str:
+    return json.dumps({
+        "winner": team2,
+        "win_probability": 70,
+        "narrative": f"{team2} outlasted {team1}.",
+    })
+
+
+class FakeBatches:
+    """
+    Stand-in for client.messages.batches that returns results out of order.
+
+    outcomes maps a custom_id to a non-success result type (e.g. "errored"), or
+    to "missing" to leave that request out of the results entirely.
+    """
+
+    def __init__(self):
+        self.outcomes = {}
+        self.submitted = []
+        self.retrieve_calls = 0
+
+    async def create(self, requests):
+        self.submitted = list(requests)
+        return SimpleNamespace(id="batch_1", processing_status="in_progress")
+
+    async def retrieve(self, batch_id):
+        self.retrieve_calls += 1
+        return SimpleNamespace(id=batch_id, processing_status="ended")
+
+    async def results(self, batch_id):
+        return self._entries()
+
+    async def _entries(self):
+        for request in reversed(self.submitted):
+            outcome = self.outcomes.get(request["custom_id"], "succeeded")
+            if outcome == "missing":
+                continue
+            if outcome != "succeeded":
+                yield SimpleNamespace(
+                    custom_id=request["custom_id"], result=SimpleNamespace(type=outcome)
+                )
+                continue
+            yield SimpleNamespace(
+                custom_id=request["custom_id"],
+                result=SimpleNamespace(
+                    type="succeeded",
+                    message=claude_message(second_team_wins(*fighters(request["params"]))),
+                ),
+            )
+
+
+class FakeStream:
+    """Stand-in for the context manager returned by client.messages.stream."""
+
+    def __init__(self, text: str = "", error: Exception = None):
+        self.text = text
+        self.error = error
+
+    async def __aenter__(self):
+        if self.error is not None:
+            raise self.error
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    @property
+    def text_stream(self):
+        return self._chunks()
+
+    async def _chunks(self):
+        for i in range(0, len(self.text), 8):
+            yield self.text[i:i + 8]
+
+
+class FakeMessages:
+    """Stand-in for client.messages where the second team always wins."""
+
+    def __init__(self):
+        self.calls = []
+        self.batches = FakeBatches()
+
+    def stream(self, **params):
+        self.calls.append(params)
+        return FakeStream(second_team_wins(*fighters(params)))
+
+
+class FakeClient:
+    """Stand-in for AsyncAnthropic; with_options records the options and returns the same client."""
+
+    def __init__(self, messages=None):
+        self.messages = messages if messages is not None else FakeMessages()
+        self.options = []
+
+    def with_options(self, **options) -> "FakeClient":
+        self.options.append(options)
+        return self
+
+
+def fake_client() -> FakeClient:
+    return FakeClient()
+
+
+class RecordingLimiter(RateLimiter):
+    """RateLimiter that records each acquire's token estimate and never waits."""
+
+    def __init__(self):
+        super().__init__()
+        self.acquired = []
+
+    async def acquire(self, estimated_input_tokens: int = 0) -> None:
+        self.acquired.append(estimated_input_tokens)
@@ -1,21 +1,14 @@
+import dataclasses
+
 import pytest
 
-from src.bracket import Bracket, Division, Team, ROUND_ONE_BRACKET
+from src.bracket import Division, Team, ROUND_ONE_BRACKET
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _make_test_bracket() -> Bracket:
-    """Create a bracket with 4 divisions, Team objects named 'Div_Team_N' (seed N)."""
-    divisions = {}
-    for div_name in ["West", "East", "South", "Midwest"]:
-        teams = [Team(name=f"{div_name}_Team_{i}", seed=i) for i in range(1, 17)]
-        divisions[div_name] = Division(name=div_name, teams=teams)
-    return Bracket(divisions=divisions)
-
-
 def _team(name: str, seed: int = 0) -> Team:
     """Shorthand for creating a Team in tests."""
     return Team(name=name, seed=seed)
@@ -27,71 +20,58 @@ def _team(name: str, seed: int = 0) -> Team:
 
 class TestRoundOneMatchups:
 
-    def test_returns_all_four_divisions(self):
-        bracket = _make_test_bracket()
+    def test_returns_all_four_divisions(self, shared_bracket):
+        bracket = shared_bracket
         matchups = bracket.get_round_one_matchups()
         assert set(matchups.keys()) == {"West", "East", "South", "Midwest"}
 
-    def test_eight_games_per_division(self):
-        bracket = _make_test_bracket()
+    def test_eight_games_per_division(self, shared_bracket):
+        bracket = shared_bracket
         matchups = bracket.get_round_one_matchups()
         for division_matchups in matchups.values():
             assert len(division_matchups) == 8
 
-    def test_first_game_is_1v16(self):
-        bracket = _make_test_bracket()
-        west = bracket.get_division_matchups("West")
-        t1, t2 = west[0]
-        assert t1.seed == 1
-        assert t2.seed == 16
-
-    def test_second_game_is_8v9(self):
-        """8 vs 9 must be in the same bracket half as 1v16 for Round 2 to work."""
-        bracket = _make_test_bracket()
-        west = bracket.get_division_matchups("West")
-        t1, t2 = west[1]
-        assert t1.seed == 8
-        assert t2.seed == 9
-
-    def test_last_game_is_2v15(self):
-        """2 vs 15 must be in the same bracket half as 7v10 for Round 2 to work."""
-        bracket = _make_test_bracket()
-        west = bracket.get_division_matchups("West")
-        t1, t2 = west[7]
-        assert t1.seed == 2
-        assert t2.seed == 15
-
-    def test_second_to_last_game_is_7v10(self):
-        bracket = _make_test_bracket()
-        west = bracket.get_division_matchups("West")
-        t1, t2 = west[6]
-        assert t1.seed == 7
-        assert t2.seed == 10
-
-    def test_round_one_bracket_order(self):
-        """Verify the full game order matches the ROUND_ONE_BRACKET constant."""
-        bracket = _make_test_bracket()
-        west = bracket.get_division_matchups("West")
-        for game_idx, (expected_s1, expected_s2) in enumerate(ROUND_ONE_BRACKET):
-            t1, t2 = west[game_idx]
-            assert t1.seed == expected_s1, f"Game {game_idx}: expected seed {expected_s1}, got {t1.seed}"
-            assert t2.seed == expected_s2, f"Game {game_idx}: expected seed {expected_s2}, got {t2.seed}"
+    @pytest.mark.parametrize(
+        "game_idx,expected_seeds",
+        list(enumerate(ROUND_ONE_BRACKET)),
+        ids=[f"{s1}v{s2}" for s1, s2 in ROUND_ONE_BRACKET],
+    )
+    def test_round_one_slot(self, shared_bracket, game_idx, expected_seeds):
+        """
+        Game order must match ROUND_ONE_BRACKET, e.g. 8v9 shares a bracket
+        half with 1v16 and 7v10 with 2v15, so Round 2 pairs them correctly.
+        """
+        t1, t2 = shared_bracket.get_division_matchups("West")[game_idx]
+        assert (t1.seed, t2.seed) == expected_seeds
 
-    def test_all_sixteen_teams_appear_exactly_once(self):
-        bracket = _make_test_bracket()
+    def test_all_sixteen_teams_appear_exactly_once(self, shared_bracket):
+        bracket = shared_bracket
         west_matchups = bracket.get_division_matchups("West")
         all_names = [team.name for pair in west_matchups for team in pair]
         assert len(all_names) == 16
         assert len(set(all_names)) == 16
 
-    def test_returns_team_objects(self):
-        bracket = _make_test_bracket()
+    def test_returns_team_objects(self, shared_bracket):
+        bracket = shared_bracket
         west = bracket.get_division_matchups("West")
         for t1, t2 in west:
             assert isinstance(t1, Team)
             assert isinstance(t2, Team)
 
-    def test_15_seed_plays_7_seed_in_round_two(self):
+    def test_seed_index_built_once(self, fresh_bracket):
+        bracket = fresh_bracket
+        bracket.get_division_matchups("West")
+        seed_index = bracket.divisions["West"].seed_index
+        bracket.get_division_matchups("West")
+        assert bracket.divisions["West"].seed_index is seed_index
+
+    def test_reassigning_teams_rebuilds_seed_index(self, fresh_bracket):
+        bracket = fresh_bracket
+        bracket.get_division_matchups("West")
+        bracket.divisions["West"].teams = [_team(f"A{i}", i) for i in range(1, 17)]
+        assert bracket.get_division_matchups("West")[0] == (_team("A1", 1), _team("A16", 16))
+
+    def test_15_seed_plays_7_seed_in_round_two(self, fresh_bracket):
         """
         Core correctness test: if the 15-seed upsets the 2-seed in Round 1,
         they should face the 7/10-seed winner in Round 2.
@@ -100,7 +80,7 @@ class TestRoundOneMatchups:
         After Round 1 winners advance, consecutive pairing gives:
           round2_game_3 = winner(7v10) vs winner(2v15)
         """
-        bracket = _make_test_bracket()
+        bracket = fresh_bracket
         r1 = bracket.get_division_matchups("West")
 
         # Simulate: 15-seed beats 2-seed; 7-seed beats 10-seed
@@ -122,7 +102,7 @@ class TestRoundOneMatchups:
         r2 = bracket.get_division_matchups("West")
         # Last Round 2 game must be slot 6 vs slot 7 = 7-seed vs 15-seed
         t1, t2 = r2[3]
-        assert {t1.seed, t2.seed} == {7, 15}
+        assert sorted((t1.seed, t2.seed)) == [7, 15]
 
 
 # ---------------------------------------------------------------------------
@@ -131,9 +111,9 @@ class TestRoundOneMatchups:
 
 class TestSubsequentRoundMatchups:
 
-    def test_round_of_8_consecutive_pairing(self):
+    def test_round_of_8_consecutive_pairing(self, fresh_bracket):
         """After advancing to 8 teams, consecutive slot pairing applies."""
-        bracket = _make_test_bracket()
+        bracket = fresh_bracket
         winners = [_team(f"W{i}", i) for i in range(8)]
         bracket.advance_round("West", winners)
         matchups = bracket.get_division_matchups("West")
@@ -143,8 +123,8 @@ class TestSubsequentRoundMatchups:
         assert matchups[2] == (_team("W4", 4), _team("W5", 5))
         assert matchups[3] == (_team("W6", 6), _team("W7", 7))
 
-    def test_round_of_4_consecutive_pairing(self):
-        bracket = _make_test_bracket()
+    def test_round_of_4_consecutive_pairing(self, fresh_bracket):
+        bracket = fresh_bracket
         a, b, c, d = _team("A", 1), _team("B", 2), _team("C", 3), _team("D", 4)
         bracket.advance_round("West", [a, b, c, d])
         matchups = bracket.get_division_matchups("West")
@@ -152,8 +132,8 @@ class TestSubsequentRoundMatchups:
         assert matchups[0] == (a, b)
         assert matchups[1] == (c, d)
 
-    def test_round_of_2_consecutive_pairing(self):
-        bracket = _make_test_bracket()
+    def test_round_of_2_consecutive_pairing(self, fresh_bracket):
+        bracket = fresh_bracket
         alpha, beta = _team("Alpha", 1), _team("Beta", 2)
         bracket.advance_round("West", [alpha, beta])
         matchups = bracket.get_division_matchups("West")
@@ -167,22 +147,28 @@ class TestSubsequentRoundMatchups:
 
 class TestAdvanceRound:
 
-    def test_advance_replaces_team_list(self):
-        bracket = _make_test_bracket()
+    def test_advance_replaces_team_list(self, fresh_bracket):
+        bracket = fresh_bracket
         winners = [_team(f"Winner_{i}", i) for i in range(8)]
         bracket.advance_round("West", winners)
         assert bracket.divisions["West"].teams == winners
 
-    def test_advance_shrinks_team_count(self):
-        bracket = _make_test_bracket()
+    def test_advance_shrinks_team_count(self, fresh_bracket):
+        bracket = fresh_bracket
         assert len(bracket.divisions["West"].teams) == 16
         bracket.advance_round("West", [_team(f"W{i}", i) for i in range(8)])
         assert len(bracket.divisions["West"].teams) == 8
         bracket.advance_round("West", [_team(f"W{i}", i) for i in range(4)])
         assert len(bracket.divisions["West"].teams) == 4
 
-    def test_advance_does_not_affect_other_divisions(self):
-        bracket = _make_test_bracket()
+    def test_advance_clears_seed_index(self, fresh_bracket):
+        bracket = fresh_bracket
+        assert 16 in bracket.divisions["West"].seed_index
+        bracket.advance_round("West", [_team(f"W{i}", i) for i in range(8)])
+        assert set(bracket.divisions["West"].seed_index) == set(range(8))
+
+    def test_advance_does_not_affect_other_divisions(self, fresh_bracket):
+        bracket = fresh_bracket
         original_east = list(bracket.divisions["East"].teams)
         bracket.advance_round("West", [_team(f"W{i}", i) for i in range(8)])
         assert bracket.divisions["East"].teams == original_east
@@ -194,24 +180,24 @@ class TestAdvanceRound:
 
 class TestFinalFourMatchups:
 
-    def test_west_vs_east_pairing(self):
-        bracket = _make_test_bracket()
+    def test_west_vs_east_pairing(self, shared_bracket):
+        bracket = shared_bracket
         tw = _team("TeamW"); te = _team("TeamE")
         ts = _team("TeamS"); tm = _team("TeamM")
         region_winners = {"West": tw, "East": te, "South": ts, "Midwest": tm}
         matchups = bracket.get_final_four_matchups(region_winners)
         assert matchups[0] == (tw, te)
 
-    def test_south_vs_midwest_pairing(self):
-        bracket = _make_test_bracket()
+    def test_south_vs_midwest_pairing(self, shared_bracket):
+        bracket = shared_bracket
         tw = _team("TeamW"); te = _team("TeamE")
         ts = _team("TeamS"); tm = _team("TeamM")
         region_winners = {"West": tw, "East": te, "South": ts, "Midwest": tm}
         matchups = bracket.get_final_four_matchups(region_winners)
         assert matchups[1] == (ts, tm)
 
-    def test_two_semifinal_games(self):
-        bracket = _make_test_bracket()
+    def test_two_semifinal_games(self, shared_bracket):
+        bracket = shared_bracket
         region_winners = {
             "West": _team("A"), "East": _team("B"),
             "South": _team("C"), "Midwest": _team("D"),
@@ -226,15 +212,41 @@ class TestFinalFourMatchups:
 
 class TestChampionshipMatchup:
 
-    def test_returns_correct_tuple(self):
-        bracket = _make_test_bracket()
+    def test_returns_correct_tuple(self, shared_bracket):
+        bracket = shared_bracket
         ta, tb = _team("TeamA"), _team("TeamB")
         result = bracket.get_championship_matchup([ta, tb])
         assert result == (ta, tb)
 
-    def test_order_preserved(self):
-        bracket = _make_test_bracket()
+    def test_order_preserved(self, shared_bracket):
+        bracket = shared_bracket
         t1, t2 = _team("Finalist1"), _team("Finalist2")
         result = bracket.get_championship_matchup([t1, t2])
         assert result[0] == t1
         assert result[1] == t2
+
+
+# ---------------------------------------------------------------------------
+# Tests: Team value semantics
+# ---------------------------------------------------------------------------
+
+class TestTeam:
+
+    def test_team_is_immutable(self):
+        team = _team("Tigers", 1)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            team.seed = 2
+
+    def test_equal_teams_hash_equal(self):
+        assert hash(_team("Tigers", 1)) == hash(_team("Tigers", 1))
+
+    def test_team_has_no_instance_dict(self):
+        assert "__slots__" in vars(Team)
+        assert not hasattr(_team("Tigers", 1), "__dict__")
+
+
+class TestDivision:
+
+    def test_division_has_no_instance_dict(self):
+        assert "__slots__" in vars(Division)
+        assert not hasattr(Division(name="West", teams=[]), "__dict__")
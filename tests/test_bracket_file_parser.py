@@ -17,15 +17,13 @@ def _make_bracket_content(
     if divisions is None:
         divisions = ["West", "East", "South", "Midwest"]
 
-    lines = []
-    for div_idx, div_name in enumerate(divisions):
-        if extra_blank_lines and div_idx > 0:
-            lines.append("")  # blank line between divisions
-        lines.append(div_name)
-        for seed in range(1, teams_per_division + 1):
-            lines.append(f"{div_name}_Team_{seed}")
-
-    return "\n".join(lines) + "\n"
+    seeds = range(1, teams_per_division + 1)
+    blocks = [
+        "\n".join([div_name, *(f"{div_name}_Team_{seed}" for seed in seeds)])
+        for div_name in divisions
+    ]
+    separator = "\n\n" if extra_blank_lines else "\n"  # blank line between divisions
+    return separator.join(blocks) + "\n"
 
 
 def _write_bracket_file(tmp_path, content: str) -> str:
@@ -34,59 +32,46 @@ def _write_bracket_file(tmp_path, content: str) -> str:
     return str(f)
 
 
+@pytest.fixture(scope="module")
+def canonical_bracket(tmp_path_factory):
+    """The standard 4-division bracket file, written and parsed once per module."""
+    path = tmp_path_factory.mktemp("brkt") / "bracket.txt"
+    path.write_text(_make_bracket_content())
+    return BracketFileParser().parse(str(path))
+
+
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
 
 class TestBracketFileParser:
 
-    def test_parse_valid_file(self, tmp_path):
-        content = _make_bracket_content()
-        filepath = _write_bracket_file(tmp_path, content)
-
-        parser = BracketFileParser()
-        bracket = parser.parse(filepath)
-
+    def test_parse_valid_file(self, canonical_bracket):
+        bracket = canonical_bracket
         assert len(bracket.divisions) == 4
         assert "West" in bracket.divisions
         assert "East" in bracket.divisions
         assert "South" in bracket.divisions
         assert "Midwest" in bracket.divisions
 
-    def test_parse_correct_team_count(self, tmp_path):
-        content = _make_bracket_content()
-        filepath = _write_bracket_file(tmp_path, content)
-
-        bracket = BracketFileParser().parse(filepath)
-
+    def test_parse_correct_team_count(self, canonical_bracket):
+        bracket = canonical_bracket
         for division in bracket.divisions.values():
             assert len(division.teams) == 16
 
-    def test_teams_are_team_objects(self, tmp_path):
-        content = _make_bracket_content()
-        filepath = _write_bracket_file(tmp_path, content)
-
-        bracket = BracketFileParser().parse(filepath)
-
+    def test_teams_are_team_objects(self, canonical_bracket):
+        bracket = canonical_bracket
         for team in bracket.divisions["West"].teams:
             assert isinstance(team, Team)
 
-    def test_parse_seed_order_preserved(self, tmp_path):
-        content = _make_bracket_content()
-        filepath = _write_bracket_file(tmp_path, content)
-
-        bracket = BracketFileParser().parse(filepath)
-
+    def test_parse_seed_order_preserved(self, canonical_bracket):
+        bracket = canonical_bracket
         west_teams = bracket.divisions["West"].teams
         assert west_teams[0].name == "West_Team_1"    # 1-seed first
         assert west_teams[15].name == "West_Team_16"   # 16-seed last
 
-    def test_seeds_assigned_from_file_position(self, tmp_path):
-        content = _make_bracket_content()
-        filepath = _write_bracket_file(tmp_path, content)
-
-        bracket = BracketFileParser().parse(filepath)
-
+    def test_seeds_assigned_from_file_position(self, canonical_bracket):
+        bracket = canonical_bracket
         west_teams = bracket.divisions["West"].teams
         assert west_teams[0].seed == 1    # first in file = 1-seed
         assert west_teams[15].seed == 16  # last in file = 16-seed
@@ -94,12 +79,8 @@ class TestBracketFileParser:
         seeds = [team.seed for team in west_teams]
         assert sorted(seeds) == list(range(1, 17))
 
-    def test_parse_division_names_set_correctly(self, tmp_path):
-        content = _make_bracket_content()
-        filepath = _write_bracket_file(tmp_path, content)
-
-        bracket = BracketFileParser().parse(filepath)
-
+    def test_parse_division_names_set_correctly(self, canonical_bracket):
+        bracket = canonical_bracket
         for name, division in bracket.divisions.items():
             assert division.name == name
 
@@ -125,6 +106,16 @@ class TestBracketFileParser:
         west_teams = bracket.divisions["West"].teams
         assert west_teams[0].name == "West_Team_1"
 
+    def test_parse_windows_line_endings_and_bom(self, tmp_path):
+        content = _make_bracket_content().replace("\n", "\r\n")
+        f = tmp_path / "bracket.txt"
+        f.write_bytes(content.encode("utf-8-sig"))
+
+        bracket = BracketFileParser().parse(str(f))
+
+        assert "West" in bracket.divisions
+        assert bracket.divisions["Midwest"].teams[15].name == "Midwest_Team_16"
+
     def test_parse_division_titles_normalized_to_title_case(self, tmp_path):
         content = _make_bracket_content(divisions=["WEST", "east", "sOuTh", "midwest"])
         filepath = _write_bracket_file(tmp_path, content)
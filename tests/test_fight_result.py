@@ -1,3 +1,5 @@
+import dataclasses
+
 import pytest
 
 from src.fight_result import FightResult
@@ -45,3 +47,13 @@ def test_empty_loser_raises():
 def test_empty_narrative_raises():
     with pytest.raises(ValueError, match="narrative"):
         FightResult("A", "B", 60, "")
+
+
+def test_fight_result_is_immutable():
+    result = FightResult("A", "B", 60, "narrative")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        result.winner = "B"
+
+
+def test_fight_result_has_no_instance_dict():
+    assert not hasattr(FightResult("A", "B", 60, "narrative"), "__dict__")
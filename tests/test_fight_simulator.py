@@ -1,8 +1,24 @@
+import asyncio
+import inspect
 import json
+import os
+import subprocess
+import sys
+from types import SimpleNamespace
+
 import pytest
 
 from src.fight_result import FightResult
-from src.fight_simulator import FightSimulator
+from src.fight_simulator import (
+    CLAUDE_MAX_TOKENS,
+    CLAUDE_MODEL,
+    CLAUDE_PROMPT_TEMPLATE,
+    CLAUDE_SYSTEM_PROMPT,
+    CLAUDE_TEMPERATURE,
+    FightSimulator,
+    _anthropic,
+)
+from tests.fakes import RecordingLimiter, fake_client
 
 
 # ---------------------------------------------------------------------------
@@ -24,70 +40,303 @@ class TestMockModeInit:
         sim = FightSimulator(mock_mode=True)
         assert sim._client is None
 
+    def test_mock_mode_never_loads_sdk(self, monkeypatch):
+        def fail():
+            raise AssertionError("mock mode must not load the anthropic SDK")
+
+        monkeypatch.setattr("src.fight_simulator._anthropic", fail)
+        for sim in (FightSimulator(mock_mode=True), FightSimulator()):
+            sim.simulate_fight("Eagles", "Bears")
+            asyncio.run(sim.close())
+            assert (sim._http_client, sim._cache, sim._rate_limiter) == (None, None, None)
+
+
+# ---------------------------------------------------------------------------
+# Tests: Client lifecycle
+# ---------------------------------------------------------------------------
+
+class TestClientLifecycle:
+
+    def test_real_mode_owns_connection_pool(self, monkeypatch):
+        pytest.importorskip("anthropic")
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+        sim = FightSimulator(cache_path=None)
+        assert sim._http_client is not None
+        asyncio.run(sim.close())
+        assert sim._http_client is None
+
+    def test_real_client_keeps_sdk_retries(self, monkeypatch):
+        sdk = pytest.importorskip("anthropic")
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+        sim = FightSimulator(cache_path=None)
+        assert sim._client.max_retries == sdk.DEFAULT_MAX_RETRIES
+        asyncio.run(sim.close())
+
+    def test_missing_sdk_reported_in_real_mode(self, monkeypatch):
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+        monkeypatch.setitem(sys.modules, "anthropic", None)
+        _anthropic.cache_clear()
+        try:
+            with pytest.raises(ImportError, match="mock_mode"):
+                FightSimulator(cache_path=None)
+        finally:
+            _anthropic.cache_clear()
+
+    def test_supplied_client_is_not_owned(self, make_simulator):
+        sim = make_simulator(client=SimpleNamespace(), cache_path=None)
+        assert sim._http_client is None
+
+    def test_warm_up_retrieves_model(self, make_simulator):
+        retrieved = []
+
+        async def retrieve(model_id):
+            retrieved.append(model_id)
+
+        client = SimpleNamespace(models=SimpleNamespace(retrieve=retrieve))
+        asyncio.run(make_simulator(client=client, cache_path=None).warm_up())
+        assert retrieved == [CLAUDE_MODEL]
+
+    def test_mock_mode_context_manager_and_warm_up_are_noops(self):
+        async def use_simulator():
+            async with FightSimulator(mock_mode=True) as sim:
+                await sim.warm_up()
+                return await sim.simulate_fight_async("Eagles", "Bears")
+
+        assert isinstance(asyncio.run(use_simulator()), FightResult)
+
 
 # ---------------------------------------------------------------------------
 # Tests: Mock fight results
 # ---------------------------------------------------------------------------
 
-class TestMockFight:
+MOCK_MATCHUPS = [
+    ("Wildcats", "Tigers"),
+    ("Eagles", "Bears"),
+    ("Spartans", "Hurricanes"),
+    ("Bulldogs", "Gators"),
+    ("Blue Devils", "Tar Heels"),
+    ("Boilermakers", "Hawkeyes"),
+]
 
-    def test_returns_fight_result_instance(self):
-        sim = FightSimulator(mock_mode=True)
-        result = sim.simulate_fight("Wildcats", "Tigers")
-        assert isinstance(result, FightResult)
 
-    def test_winner_is_one_of_two_teams(self):
-        sim = FightSimulator(mock_mode=True)
-        result = sim.simulate_fight("Wildcats", "Tigers")
-        assert result.winner in ("Wildcats", "Tigers")
+@pytest.fixture(scope="class")
+def sim():
+    """One mock-mode simulator shared by every test in a class."""
+    return FightSimulator(mock_mode=True)
 
-    def test_loser_is_the_other_team(self):
-        sim = FightSimulator(mock_mode=True)
-        result = sim.simulate_fight("Wildcats", "Tigers")
-        teams = {"Wildcats", "Tigers"}
-        assert result.loser in teams
+
+class TestMockFight:
+
+    @pytest.mark.parametrize("team1,team2", MOCK_MATCHUPS)
+    def test_winner_and_loser_are_the_two_teams(self, sim, team1, team2):
+        result = sim.simulate_fight(team1, team2)
+        assert isinstance(result, FightResult)
+        assert result.winner in (team1, team2)
+        assert result.loser in (team1, team2)
         assert result.winner != result.loser
 
-    def test_probability_in_valid_range(self):
-        sim = FightSimulator(mock_mode=True)
-        result = sim.simulate_fight("Eagles", "Bears")
+    @pytest.mark.parametrize("team1,team2", MOCK_MATCHUPS)
+    def test_probability_in_valid_range(self, sim, team1, team2):
+        result = sim.simulate_fight(team1, team2)
         assert 0 <= result.win_probability <= 100
 
-    def test_narrative_is_nonempty(self):
-        sim = FightSimulator(mock_mode=True)
-        result = sim.simulate_fight("Eagles", "Bears")
+    @pytest.mark.parametrize("team1,team2", MOCK_MATCHUPS)
+    def test_narrative_is_nonempty(self, sim, team1, team2):
+        result = sim.simulate_fight(team1, team2)
         assert len(result.narrative) > 0
 
-    def test_mock_is_deterministic(self):
-        sim = FightSimulator(mock_mode=True)
+    def test_mock_is_deterministic(self, sim):
         r1 = sim.simulate_fight("Eagles", "Bears")
         r2 = sim.simulate_fight("Eagles", "Bears")
         assert r1.winner == r2.winner
         assert r1.win_probability == r2.win_probability
 
-    def test_mock_same_result_regardless_of_argument_order(self):
-        sim = FightSimulator(mock_mode=True)
+    def test_mock_results_are_memoized(self):
+        first = FightSimulator(mock_mode=True).simulate_fight("Eagles", "Bears")
+        second = FightSimulator(mock_mode=True).simulate_fight("Eagles", "Bears")
+        assert second is first
+
+    def test_mock_same_result_regardless_of_argument_order(self, sim):
         r1 = sim.simulate_fight("Eagles", "Bears")
         r2 = sim.simulate_fight("Bears", "Eagles")
         assert r1.winner == r2.winner
         assert r1.win_probability == r2.win_probability
 
-    def test_different_matchups_can_produce_different_winners(self):
+    def test_mock_is_stable_across_hash_seeds(self):
+        code = (
+            "from src.fight_simulator import FightSimulator; "
+            "r = FightSimulator(mock_mode=True).simulate_fight('Eagles', 'Bears'); "
+            "print(r.winner, r.win_probability)"
+        )
+        repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        outputs = set()
+        for hash_seed in ("1", "2"):
+            env = {**os.environ, "PYTHONHASHSEED": hash_seed}
+            completed = subprocess.run(
+                [sys.executable, "-c", code],
+                cwd=repo_root, env=env, capture_output=True, text=True, check=True,
+            )
+            outputs.add(completed.stdout)
+        assert len(outputs) == 1
+
+    def test_different_matchups_can_produce_different_winners(self, sim):
+        winners = [sim.simulate_fight(t1, t2).winner for t1, t2 in MOCK_MATCHUPS]
+        # With 6 different matchups we expect at least 2 distinct winners
+        assert len(set(winners)) >= 2
+
+    def test_async_matches_sync_result(self, sim):
+        sync_result = sim.simulate_fight("Eagles", "Bears")
+        async_result = asyncio.run(sim.simulate_fight_async("Eagles", "Bears"))
+        assert async_result == sync_result
+
+
+# ---------------------------------------------------------------------------
+# Tests: simulate_batch
+# ---------------------------------------------------------------------------
+
+class TestSimulateBatch:
+
+    def test_mock_batch_matches_individual_fights(self):
         sim = FightSimulator(mock_mode=True)
-        results = set()
-        pairs = [
-            ("Wildcats", "Tigers"),
-            ("Eagles", "Bears"),
-            ("Spartans", "Hurricanes"),
-            ("Bulldogs", "Gators"),
-            ("Blue Devils", "Tar Heels"),
-            ("Boilermakers", "Hawkeyes"),
+        pairs = [("Wildcats", "Tigers"), ("Eagles", "Bears")]
+        results = sim.simulate_batch(pairs)
+        assert results == [sim.simulate_fight(t1, t2) for t1, t2 in pairs]
+
+    def test_supplying_client_disables_mock_mode(self, make_simulator):
+        sim = make_simulator(client=fake_client(), cache_path=None)
+        assert sim.mock_mode is False
+
+    def test_results_mapped_back_by_custom_id(self, make_simulator, monkeypatch):
+        monkeypatch.setattr("src.fight_simulator.BATCH_POLL_INTERVAL_SECONDS", 0)
+        client = fake_client()
+        sim = make_simulator(client=client, cache_path=None)
+        pairs = [("Wildcats", "Tigers"), ("Eagles", "Bears"), ("Ducks", "Beavers")]
+
+        results = asyncio.run(sim.simulate_batch_async(pairs))
+
+        assert [r.winner for r in results] == ["Tigers", "Bears", "Beavers"]
+        assert [r.loser for r in results] == ["Wildcats", "Eagles", "Ducks"]
+        assert [req["custom_id"] for req in client.messages.batches.submitted] == ["0", "1", "2"]
+        assert client.messages.batches.retrieve_calls == 1
+
+    def test_failed_batch_entry_raises(self, make_simulator, monkeypatch):
+        monkeypatch.setattr("src.fight_simulator.BATCH_POLL_INTERVAL_SECONDS", 0)
+        client = fake_client()
+        client.messages.batches.outcomes = {"0": "errored"}
+        sim = make_simulator(client=client, cache_path=None)
+        with pytest.raises(ValueError, match="did not succeed"):
+            asyncio.run(sim.simulate_batch_async([("Wildcats", "Tigers")]))
+
+    def test_failure_still_caches_other_succeeded_entries(self, make_simulator, tmp_path, monkeypatch):
+        monkeypatch.setattr("src.fight_simulator.BATCH_POLL_INTERVAL_SECONDS", 0)
+        client = fake_client()
+        client.messages.batches.outcomes = {"0": "errored", "2": "expired"}
+        sim = make_simulator(client=client, cache_path=str(tmp_path / "cache"))
+        pairs = [("Wildcats", "Tigers"), ("Eagles", "Bears"), ("Spartans", "Gators")]
+        with pytest.raises(ValueError) as excinfo:
+            sim.simulate_batch(pairs)
+        message = str(excinfo.value)
+        assert "0: 'Wildcats' vs 'Tigers' - errored" in message
+        assert "2: 'Spartans' vs 'Gators' - expired" in message
+        assert sim._cache_lookup("Eagles", "Bears").winner == "Bears"
+
+    def test_missing_entry_raises(self, make_simulator, monkeypatch):
+        monkeypatch.setattr("src.fight_simulator.BATCH_POLL_INTERVAL_SECONDS", 0)
+        client = fake_client()
+        client.messages.batches.outcomes = {"1": "missing"}
+        sim = make_simulator(client=client, cache_path=None)
+        with pytest.raises(ValueError, match="1: 'Eagles' vs 'Bears' - missing from batch results"):
+            sim.simulate_batch([("Wildcats", "Tigers"), ("Eagles", "Bears")])
+
+    def test_empty_batch_submits_nothing(self, make_simulator):
+        client = fake_client()
+        sim = make_simulator(client=client, cache_path=None)
+        assert asyncio.run(sim.simulate_batch_async([])) == []
+        assert client.messages.batches.submitted == []
+
+
+# ---------------------------------------------------------------------------
+# Tests: Claude fights
+# ---------------------------------------------------------------------------
+
+class TestClaudeFight:
+
+    def test_streamed_chunks_are_reassembled(self, make_simulator):
+        client = fake_client()
+        sim = make_simulator(client=client, cache_path=None)
+        result = sim.simulate_fight("Wildcats", "Tigers")
+        assert result.narrative == "Tigers outlasted Wildcats."
+        assert client.messages.calls == [{
+            **sim._message_params("Wildcats", "Tigers"),
+            "extra_body": {"temperature": CLAUDE_TEMPERATURE},
+        }]
+
+
+# ---------------------------------------------------------------------------
+# Tests: rate limiting
+# ---------------------------------------------------------------------------
+
+class TestRateLimiting:
+
+    def test_each_claude_call_acquires_once(self, make_simulator):
+        limiter = RecordingLimiter()
+        sim = make_simulator(client=fake_client(), cache_path=None, rate_limiter=limiter)
+        sim.simulate_fight("Wildcats", "Tigers")
+        assert len(limiter.acquired) == 1
+        assert limiter.acquired[0] > len(CLAUDE_SYSTEM_PROMPT) // 8
+
+    def test_mock_mode_has_no_limiter(self):
+        assert FightSimulator(mock_mode=True)._rate_limiter is None
+
+
+# ---------------------------------------------------------------------------
+# Tests: _message_params
+# ---------------------------------------------------------------------------
+
+class TestMessageParams:
+
+    def test_static_rules_sent_as_cached_system_prompt(self):
+        params = FightSimulator(mock_mode=True)._message_params("Wildcats", "Tigers")
+        (system_block,) = params["system"]
+        assert system_block["text"] == CLAUDE_SYSTEM_PROMPT
+        assert system_block["cache_control"] == {"type": "ephemeral"}
+
+    def test_user_message_matches_template(self):
+        params = FightSimulator(mock_mode=True)._message_params("{Odd} Ducks", "Tigers")
+        expected = CLAUDE_PROMPT_TEMPLATE.format(team1="{Odd} Ducks", team2="Tigers")
+        assert params["messages"][0]["content"] == expected
+
+    def test_generation_settings(self):
+        params = FightSimulator(mock_mode=True)._message_params("Wildcats", "Tigers")
+        assert params["model"] == CLAUDE_MODEL
+        assert params["max_tokens"] == CLAUDE_MAX_TOKENS
+
+    def test_params_bind_to_sdk_stream_signature(self):
+        """The fake clients accept **params, so check them against the real SDK."""
+        sdk = pytest.importorskip("anthropic")
+        params = FightSimulator(mock_mode=True)._message_params("Wildcats", "Tigers")
+        stream_signature = inspect.signature(sdk.resources.messages.AsyncMessages.stream)
+        stream_signature.bind(None, **params, extra_body={"temperature": CLAUDE_TEMPERATURE})
+
+    def test_streamed_fight_sends_temperature_in_body(self, make_simulator):
+        sim = make_simulator(client=fake_client(), cache_path=None)
+        sim.simulate_fight("Wildcats", "Tigers")
+        (call,) = sim._client.messages.calls
+        assert "temperature" not in call
+        assert call["extra_body"] == {"temperature": CLAUDE_TEMPERATURE}
+
+    def test_batched_fight_sends_temperature(self, make_simulator, monkeypatch):
+        monkeypatch.setattr("src.fight_simulator.BATCH_POLL_INTERVAL_SECONDS", 0)
+        sim = make_simulator(client=fake_client(), cache_path=None)
+        sim.simulate_batch([("Wildcats", "Tigers")])
+        (request,) = sim._client.messages.batches.submitted
+        assert request["params"]["temperature"] == CLAUDE_TEMPERATURE
+
+    def test_user_message_only_names_the_fighters(self):
+        params = FightSimulator(mock_mode=True)._message_params("Wildcats", "Tigers")
+        assert params["messages"] == [
+            {"role": "user", "content": "FIGHTER 1: Wildcats\nFIGHTER 2: Tigers"}
         ]
-        for t1, t2 in pairs:
-            r = sim.simulate_fight(t1, t2)
-            results.add(r.winner)
-        # With 6 different matchups we expect at least 2 distinct winners
-        assert len(results) >= 2
 
 
 # ---------------------------------------------------------------------------
@@ -97,70 +346,169 @@ class TestMockFight:
 class TestParseClaudeResponse:
 
     def test_valid_json_returns_fight_result(self):
-        sim = FightSimulator(mock_mode=True)
         raw = json.dumps({
             "winner": "Wildcats",
             "win_probability": 72,
             "narrative": "Wildcats pounced with terrifying speed.",
         })
-        result = sim._parse_claude_response(raw, "Wildcats", "Tigers")
+        result = FightSimulator._parse_claude_response(raw, "Wildcats", "Tigers")
         assert result.winner == "Wildcats"
         assert result.loser == "Tigers"
         assert result.win_probability == 72
         assert result.narrative == "Wildcats pounced with terrifying speed."
 
     def test_winner_can_be_second_team(self):
-        sim = FightSimulator(mock_mode=True)
         raw = json.dumps({
             "winner": "Tigers",
             "win_probability": 63,
             "narrative": "Tigers roared back.",
         })
-        result = sim._parse_claude_response(raw, "Wildcats", "Tigers")
+        result = FightSimulator._parse_claude_response(raw, "Wildcats", "Tigers")
         assert result.winner == "Tigers"
         assert result.loser == "Wildcats"
 
     def test_strips_markdown_code_fence(self):
-        sim = FightSimulator(mock_mode=True)
         raw = "```json\n" + json.dumps({
             "winner": "Wildcats",
             "win_probability": 80,
             "narrative": "Dominant.",
         }) + "\n```"
-        result = sim._parse_claude_response(raw, "Wildcats", "Tigers")
+        result = FightSimulator._parse_claude_response(raw, "Wildcats", "Tigers")
         assert result.winner == "Wildcats"
 
     def test_strips_plain_code_fence(self):
-        sim = FightSimulator(mock_mode=True)
         raw = "```\n" + json.dumps({
             "winner": "Tigers",
             "win_probability": 55,
             "narrative": "Barely.",
         }) + "\n```"
-        result = sim._parse_claude_response(raw, "Wildcats", "Tigers")
+        result = FightSimulator._parse_claude_response(raw, "Wildcats", "Tigers")
         assert result.winner == "Tigers"
 
+    def test_ignores_text_and_braces_after_object(self):
+        raw = "Here you go: " + json.dumps({
+            "winner": "Wildcats",
+            "win_probability": 66,
+            "narrative": "Claws { fangs.",
+        }) + "}} Hope that helps!"
+        result = FightSimulator._parse_claude_response(raw, "Wildcats", "Tigers")
+        assert result.winner == "Wildcats"
+        assert result.narrative == "Claws { fangs."
+
+    def test_unterminated_json_raises_value_error(self):
+        raw = '{"winner": "Wildcats", "win_probability": 66'
+        with pytest.raises(ValueError, match="JSON"):
+            FightSimulator._parse_claude_response(raw, "Wildcats", "Tigers")
+
     def test_invalid_json_raises_value_error(self):
-        sim = FightSimulator(mock_mode=True)
         with pytest.raises(ValueError, match="JSON"):
-            sim._parse_claude_response("not json at all", "Wildcats", "Tigers")
+            FightSimulator._parse_claude_response("not json at all", "Wildcats", "Tigers")
 
     def test_unknown_winner_raises_value_error(self):
-        sim = FightSimulator(mock_mode=True)
         raw = json.dumps({
             "winner": "UnknownTeam",
             "win_probability": 60,
             "narrative": "Mystery winner.",
         })
         with pytest.raises(ValueError, match="winner"):
-            sim._parse_claude_response(raw, "Wildcats", "Tigers")
+            FightSimulator._parse_claude_response(raw, "Wildcats", "Tigers")
 
     def test_case_insensitive_winner_matching(self):
-        sim = FightSimulator(mock_mode=True)
         raw = json.dumps({
             "winner": "wildcats",  # lowercase
             "win_probability": 70,
             "narrative": "Won.",
         })
-        result = sim._parse_claude_response(raw, "Wildcats", "Tigers")
+        result = FightSimulator._parse_claude_response(raw, "Wildcats", "Tigers")
         assert result.winner == "Wildcats"  # normalized to original casing
+
+    def test_substring_winner_matching(self):
+        raw = json.dumps({
+            "winner": "The Tigers",
+            "win_probability": 58,
+            "narrative": "Won.",
+        })
+        result = FightSimulator._parse_claude_response(raw, "Wildcats", "Tigers")
+        assert result.winner == "Tigers"
+        assert result.loser == "Wildcats"
+
+
+# ---------------------------------------------------------------------------
+# Tests: result cache
+# ---------------------------------------------------------------------------
+
+class TestResultCache:
+
+    def test_cache_key_ignores_order_and_case(self):
+        assert FightSimulator._cache_key("Wildcats", "Tigers") == FightSimulator._cache_key("tigers", "WILDCATS")
+
+    @pytest.mark.parametrize("setting,value", [
+        ("CLAUDE_MODEL", "claude-other-model"),
+        ("CLAUDE_SYSTEM_PROMPT", "Different rules."),
+        ("CLAUDE_MAX_TOKENS", 512),
+        ("CLAUDE_TEMPERATURE", 1.0),
+    ])
+    def test_cache_key_changes_with_request_settings(self, monkeypatch, setting, value):
+        original = FightSimulator._cache_key("Wildcats", "Tigers")
+        monkeypatch.setattr(f"src.fight_simulator.{setting}", value)
+        assert FightSimulator._cache_key("Wildcats", "Tigers") != original
+
+    def test_settings_change_bypasses_cached_result(self, make_simulator, tmp_path, monkeypatch):
+        client = fake_client()
+        sim = make_simulator(client=client, cache_path=str(tmp_path / "cache"))
+        sim.simulate_fight("Wildcats", "Tigers")
+        monkeypatch.setattr("src.fight_simulator.CLAUDE_MODEL", "claude-other-model")
+        sim.simulate_fight("Wildcats", "Tigers")
+        assert len(client.messages.calls) == 2
+
+    def test_repeat_fight_served_from_cache(self, make_simulator, tmp_path):
+        client = fake_client()
+        sim = make_simulator(client=client, cache_path=str(tmp_path / "cache"))
+        first = sim.simulate_fight("Wildcats", "Tigers")
+        second = sim.simulate_fight("Wildcats", "Tigers")
+        assert second == first
+        assert len(client.messages.calls) == 1
+
+    def test_cached_result_follows_argument_order(self, make_simulator, tmp_path):
+        client = fake_client()
+        sim = make_simulator(client=client, cache_path=str(tmp_path / "cache"))
+        sim.simulate_fight("Wildcats", "Tigers")
+        result = sim.simulate_fight("tigers", "wildcats")
+        assert result.winner == "tigers"
+        assert result.loser == "wildcats"
+        assert len(client.messages.calls) == 1
+
+    def test_no_cache_forces_new_call(self, make_simulator, tmp_path):
+        client = fake_client()
+        sim = make_simulator(client=client, cache_path=str(tmp_path / "cache"))
+        sim.simulate_fight("Wildcats", "Tigers")
+        sim.simulate_fight("Wildcats", "Tigers", no_cache=True)
+        assert len(client.messages.calls) == 2
+
+    def test_cache_persists_across_simulators(self, make_simulator, tmp_path):
+        cache_path = str(tmp_path / "cache")
+        first_sim = make_simulator(client=fake_client(), cache_path=cache_path)
+        first = first_sim.simulate_fight("Wildcats", "Tigers")
+        asyncio.run(first_sim.close())
+
+        client = fake_client()
+        second_sim = make_simulator(client=client, cache_path=cache_path)
+        assert second_sim.simulate_fight("Wildcats", "Tigers") == first
+        assert client.messages.calls == []
+
+    def test_batch_only_submits_cache_misses(self, make_simulator, tmp_path, monkeypatch):
+        monkeypatch.setattr("src.fight_simulator.BATCH_POLL_INTERVAL_SECONDS", 0)
+        client = fake_client()
+        sim = make_simulator(client=client, cache_path=str(tmp_path / "cache"))
+        sim.simulate_fight("Eagles", "Bears")
+
+        results = sim.simulate_batch([("Wildcats", "Tigers"), ("Eagles", "Bears")])
+
+        assert [r.winner for r in results] == ["Tigers", "Bears"]
+        assert [req["custom_id"] for req in client.messages.batches.submitted] == ["0"]
+
+    def test_mock_mode_does_not_open_cache(self, tmp_path):
+        cache_path = tmp_path / "cache"
+        sim = FightSimulator(mock_mode=True, cache_path=str(cache_path))
+        assert sim._cache is None
+        assert list(tmp_path.iterdir()) == []
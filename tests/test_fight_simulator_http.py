@@ -0,0 +1,88 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+# These tests drive the real SDK client against a local stub of the Messages API
+pytest.importorskip("anthropic")
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _sse_events(text: str) -> bytes:
+    """A streamed Messages API response whose only content is the given text."""
+    events = [
+        ("message_start", {"type": "message_start", "message": {
+            "id": "msg_1", "type": "message", "role": "assistant", "model": "stub",
+            "content": [], "stop_reason": None, "stop_sequence": None,
+            "usage": {"input_tokens": 1, "output_tokens": 1},
+        }}),
+        ("content_block_start", {"type": "content_block_start", "index": 0,
+                                 "content_block": {"type": "text", "text": ""}}),
+        ("content_block_delta", {"type": "content_block_delta", "index": 0,
+                                 "delta": {"type": "text_delta", "text": text}}),
+        ("content_block_stop", {"type": "content_block_stop", "index": 0}),
+        ("message_delta", {"type": "message_delta",
+                           "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                           "usage": {"output_tokens": 1}}),
+        ("message_stop", {"type": "message_stop"}),
+    ]
+    return "".join(
+        f"event: {name}\ndata: {json.dumps(data)}\n\n" for name, data in events
+    ).encode()
+
+
+class StubMessagesHandler(BaseHTTPRequestHandler):
+    """Answers every POST /v1/messages with a win for the second fighter."""
+
+    protocol_version = "HTTP/1.1"  # Keep-alive, so the client pools the connection
+
+    def do_POST(self):
+        self.server.client_ports.append(self.client_address[1])
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        prompt = request["messages"][0]["content"]
+        team2 = prompt.split("FIGHTER 2: ")[1]
+        body = _sse_events(json.dumps({
+            "winner": team2, "win_probability": 70, "narrative": f"{team2} won.",
+        }))
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_api(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubMessagesHandler)
+    server.client_ports = []  # One entry per request, so reused connections repeat a port
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    monkeypatch.setenv("ANTHROPIC_BASE_URL", f"http://127.0.0.1:{server.server_port}")
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+class TestBlockingCallsOnRealClient:
+
+    def test_consecutive_blocking_fights_reuse_the_connection_pool(self, stub_api, make_simulator):
+        sim = make_simulator(cache_path=None)
+        first = sim.simulate_fight("Wildcats", "Tigers")
+        second = sim.simulate_fight("Eagles", "Bears")
+        assert (first.winner, second.winner) == ("Tigers", "Bears")
+        # Both requests went over one pooled connection, with no failed attempt in between
+        assert len(stub_api.client_ports) == 2
+        assert len(set(stub_api.client_ports)) == 1
@@ -0,0 +1,99 @@
+from types import SimpleNamespace
+
+import pytest
+
+from src.fight_simulator import (
+    BACKOFF_JITTER_SECONDS,
+    FightSimulator,
+    INITIAL_BACKOFF_SECONDS,
+    MAX_API_ATTEMPTS,
+)
+from tests.fakes import FakeClient, FakeMessages, FakeStream, RecordingLimiter
+
+# Retry classification uses the SDK's exception types; everything else in the
+# fight simulator tests runs without the SDK installed
+anthropic = pytest.importorskip("anthropic")
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _status_error(status_code: int) -> anthropic.APIStatusError:
+    response = SimpleNamespace(status_code=status_code, request=None, headers={})
+    return anthropic.APIStatusError("error", response=response, body=None)
+
+
+class FlakyMessages(FakeMessages):
+    """FakeMessages whose first calls raise the given errors."""
+
+    def __init__(self, errors):
+        super().__init__()
+        self.errors = list(errors)
+
+    def stream(self, **params):
+        if self.errors:
+            self.calls.append(params)
+            return FakeStream(error=self.errors.pop(0))
+        return super().stream(**params)
+
+
+@pytest.fixture
+def backoff_sleeps(monkeypatch):
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    monkeypatch.setattr("src.fight_simulator.asyncio.sleep", fake_sleep)
+    return sleeps
+
+
+def _flaky_simulator(make_simulator, errors) -> FightSimulator:
+    client = FakeClient(messages=FlakyMessages(errors))
+    return make_simulator(client=client, cache_path=None, rate_limiter=RecordingLimiter())
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+class TestRetries:
+
+    def test_transient_errors_are_retried(self, make_simulator, backoff_sleeps):
+        errors = [
+            anthropic.APIConnectionError(request=None),
+            _status_error(429),
+            _status_error(529),
+        ]
+        sim = _flaky_simulator(make_simulator, errors)
+        result = sim.simulate_fight("Wildcats", "Tigers")
+        assert result.winner == "Tigers"
+        assert len(sim._client.messages.calls) == 4
+        assert len(backoff_sleeps) == 3
+
+    def test_backoff_starts_at_half_a_second_and_doubles(self, make_simulator, backoff_sleeps):
+        sim = _flaky_simulator(make_simulator, [_status_error(500)] * 3)
+        sim.simulate_fight("Wildcats", "Tigers")
+        for attempt, seconds in enumerate(backoff_sleeps):
+            base = INITIAL_BACKOFF_SECONDS * 2**attempt
+            assert base <= seconds <= base + BACKOFF_JITTER_SECONDS
+
+    def test_client_errors_are_not_retried(self, make_simulator, backoff_sleeps):
+        sim = _flaky_simulator(make_simulator, [_status_error(400)])
+        with pytest.raises(anthropic.APIStatusError):
+            sim.simulate_fight("Wildcats", "Tigers")
+        assert len(sim._client.messages.calls) == 1
+        assert backoff_sleeps == []
+
+    def test_streamed_call_disables_sdk_retries(self, make_simulator, backoff_sleeps):
+        sim = _flaky_simulator(make_simulator, [])
+        sim.simulate_fight("Wildcats", "Tigers")
+        assert sim._client.options == [{"max_retries": 0}]
+
+    def test_gives_up_after_max_attempts(self, make_simulator, backoff_sleeps):
+        sim = _flaky_simulator(make_simulator, [_status_error(503)] * MAX_API_ATTEMPTS)
+        with pytest.raises(anthropic.APIStatusError):
+            sim.simulate_fight("Wildcats", "Tigers")
+        assert len(sim._client.messages.calls) == MAX_API_ATTEMPTS
+        assert len(sim._rate_limiter.acquired) == MAX_API_ATTEMPTS
@@ -0,0 +1,28 @@
+from pathlib import Path
+
+pytest_plugins = ["pytester"]
+
+PYTEST_INI = Path(__file__).resolve().parent.parent / "pytest.ini"
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+class TestResourceWarningsFail:
+
+    def test_leaked_file_handle_fails_the_test(self, pytester):
+        pytester.makeini(PYTEST_INI.read_text())
+        pytester.makepyfile(
+            """
+            import gc
+
+            def test_leak(tmp_path):
+                path = tmp_path / "leak.txt"
+                path.write_text("x")
+                open(path).read()
+                gc.collect()
+            """
+        )
+        result = pytester.runpytest_inprocess()
+        result.assert_outcomes(failed=1)
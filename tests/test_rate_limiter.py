@@ -0,0 +1,77 @@
+import asyncio
+import pytest
+
+from src.rate_limiter import RateLimiter
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+class FakeClock:
+    """Replaces time.monotonic and asyncio.sleep so waits finish instantly."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr("src.rate_limiter.monotonic", fake.monotonic)
+    monkeypatch.setattr("src.rate_limiter.asyncio.sleep", fake.sleep)
+    return fake
+
+
+async def _acquire(limiter: RateLimiter, times: int, tokens: int = 0) -> None:
+    for _ in range(times):
+        await limiter.acquire(tokens)
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+class TestRateLimiter:
+
+    def test_no_wait_within_budget(self, clock):
+        limiter = RateLimiter(requests_per_minute=5, tokens_per_minute=1000)
+        asyncio.run(_acquire(limiter, 5, tokens=200))
+        assert clock.sleeps == []
+
+    def test_waits_when_requests_exhausted(self, clock):
+        limiter = RateLimiter(requests_per_minute=2, tokens_per_minute=1000)
+        asyncio.run(_acquire(limiter, 3))
+        # One request refills every 30 seconds at 2 per minute
+        assert sum(clock.sleeps) == pytest.approx(30.0)
+
+    def test_waits_when_tokens_exhausted(self, clock):
+        limiter = RateLimiter(requests_per_minute=100, tokens_per_minute=1000)
+
+        async def scenario():
+            await _acquire(limiter, 1, tokens=800)
+            await _acquire(limiter, 1, tokens=400)
+
+        asyncio.run(scenario())
+        # 200-token shortfall at 1000 tokens per minute
+        assert sum(clock.sleeps) == pytest.approx(12.0)
+
+    def test_budget_refills_over_time(self, clock):
+        limiter = RateLimiter(requests_per_minute=2, tokens_per_minute=1000)
+        asyncio.run(_acquire(limiter, 2))
+        clock.now += 60
+        asyncio.run(_acquire(limiter, 2))
+        assert clock.sleeps == []
+
+    def test_oversized_request_is_clamped(self, clock):
+        limiter = RateLimiter(requests_per_minute=10, tokens_per_minute=1000)
+        asyncio.run(_acquire(limiter, 1, tokens=5000))
+        assert clock.sleeps == []
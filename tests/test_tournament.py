@@ -1,7 +1,9 @@
+import asyncio
 import os
+from pathlib import Path
+
 import pytest
 
-from src.bracket import Bracket, Division, Team
 from src.fight_result import FightResult
 from src.fight_simulator import FightSimulator
 from src.tournament import Tournament
@@ -11,15 +13,6 @@ from src.tournament import Tournament
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _make_test_bracket() -> Bracket:
-    """Create a bracket with 4 divisions, 16 Team objects each."""
-    divisions = {}
-    for div_name in ["West", "East", "South", "Midwest"]:
-        teams = [Team(name=f"{div_name}_Team_{i}", seed=i) for i in range(1, 17)]
-        divisions[div_name] = Division(name=div_name, teams=teams)
-    return Bracket(divisions=divisions)
-
-
 class AlwaysFirstSimulator:
     """Mock simulator that always picks team1 (the first argument) as winner."""
 
@@ -31,6 +24,12 @@ class AlwaysFirstSimulator:
             narrative=f"{team1} crushed {team2} without breaking a sweat.",
         )
 
+    async def simulate_fight_async(self, team1: str, team2: str) -> FightResult:
+        return self.simulate_fight(team1, team2)
+
+    async def close(self) -> None:
+        self.closed = True
+
 
 class CountingSimulator:
     """Mock simulator that counts calls and always picks team1."""
@@ -47,93 +46,254 @@ class CountingSimulator:
             narrative="Win.",
         )
 
+    async def simulate_fight_async(self, team1: str, team2: str) -> FightResult:
+        return self.simulate_fight(team1, team2)
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class ConcurrencyTrackingSimulator(AlwaysFirstSimulator):
+    """Mock simulator that records the peak number of fights in flight at once."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def simulate_fight_async(self, team1: str, team2: str) -> FightResult:
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        return self.simulate_fight(team1, team2)
+
+
+class OutOfOrderSimulator(AlwaysFirstSimulator):
+    """Mock simulator whose later calls finish before earlier ones."""
+
+    def __init__(self):
+        self.calls_started = 0
+
+    async def simulate_fight_async(self, team1: str, team2: str) -> FightResult:
+        self.calls_started += 1
+        for _ in range(max(0, 10 - self.calls_started % 10)):
+            await asyncio.sleep(0)
+        return self.simulate_fight(team1, team2)
+
+
+class EventLogSimulator(AlwaysFirstSimulator):
+    """Mock simulator that logs when each fight starts and finishes."""
+
+    def __init__(self):
+        self.events = []
+
+    async def simulate_fight_async(self, team1: str, team2: str) -> FightResult:
+        self.events.append(("start", team1, team2))
+        await asyncio.sleep(0)
+        self.events.append(("end", team1, team2))
+        return self.simulate_fight(team1, team2)
+
+
+class WrongWinnerSimulator(AlwaysFirstSimulator):
+    """Mock simulator whose results name a team that was not in the fight."""
+
+    def simulate_fight(self, team1: str, team2: str) -> FightResult:
+        return FightResult(
+            winner="Somebody Else",
+            loser=team2,
+            win_probability=50,
+            narrative="Confusion.",
+        )
+
+
+class BatchRecordingSimulator(AlwaysFirstSimulator):
+    """Mock simulator that records the size of every batch it is given."""
+
+    def __init__(self):
+        self.batch_sizes = []
+        self.single_fights = 0
+
+    async def simulate_batch_async(self, pairs: list) -> list:
+        self.batch_sizes.append(len(pairs))
+        return [self.simulate_fight(team1, team2) for team1, team2 in pairs]
+
+    async def simulate_fight_async(self, team1: str, team2: str) -> FightResult:
+        self.single_fights += 1
+        return self.simulate_fight(team1, team2)
+
+
+@pytest.fixture(scope="module")
+def always_first_run(tmp_path_factory, make_bracket):
+    """One full AlwaysFirstSimulator run shared by the module; returns (path, content)."""
+    output_file = tmp_path_factory.mktemp("trn") / "run1.txt"
+    Tournament(make_bracket(), AlwaysFirstSimulator(), str(output_file)).run()
+    return str(output_file), output_file.read_text()
+
+
+@pytest.fixture(scope="module")
+def always_first_run_content(always_first_run):
+    """Output text of the shared AlwaysFirstSimulator run."""
+    return always_first_run[1]
+
 
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
 
+class TestTournamentInit:
+
+    def test_default_output_path(self, fresh_bracket):
+        tournament = Tournament(fresh_bracket, AlwaysFirstSimulator())
+        assert tournament.output_file == "output/run1.txt"
+
+
+@pytest.mark.slow
 class TestTournamentRun:
 
-    def test_full_run_creates_output_file(self, tmp_path):
-        output_file = str(tmp_path / "run1.txt")
-        tournament = Tournament(_make_test_bracket(), AlwaysFirstSimulator(), output_file)
-        tournament.run()
+    def test_full_run_creates_output_file(self, always_first_run):
+        output_file, _ = always_first_run
         assert os.path.exists(output_file)
 
-    def test_output_contains_championship_header(self, tmp_path):
-        output_file = str(tmp_path / "run1.txt")
-        tournament = Tournament(_make_test_bracket(), AlwaysFirstSimulator(), output_file)
-        tournament.run()
-        content = open(output_file).read()
+    def test_output_contains_championship_header(self, always_first_run_content):
+        content = always_first_run_content
         assert "CHAMPIONSHIP" in content
 
-    def test_output_contains_champion_line(self, tmp_path):
-        output_file = str(tmp_path / "run1.txt")
-        tournament = Tournament(_make_test_bracket(), AlwaysFirstSimulator(), output_file)
-        tournament.run()
-        content = open(output_file).read()
+    def test_output_contains_champion_line(self, always_first_run_content):
+        content = always_first_run_content
         assert "MASCOT MADNESS CHAMPION" in content
 
-    def test_output_contains_final_four_header(self, tmp_path):
-        output_file = str(tmp_path / "run1.txt")
-        tournament = Tournament(_make_test_bracket(), AlwaysFirstSimulator(), output_file)
-        tournament.run()
-        content = open(output_file).read()
+    def test_output_contains_final_four_header(self, always_first_run_content):
+        content = always_first_run_content
         assert "FINAL FOUR" in content
 
-    def test_output_contains_all_division_names(self, tmp_path):
-        output_file = str(tmp_path / "run1.txt")
-        tournament = Tournament(_make_test_bracket(), AlwaysFirstSimulator(), output_file)
-        tournament.run()
-        content = open(output_file).read()
+    def test_output_contains_all_division_names(self, always_first_run_content):
+        content = always_first_run_content
         for div in ["WEST", "EAST", "SOUTH", "MIDWEST"]:
             assert div in content
 
-    def test_output_dir_created_if_missing(self, tmp_path):
+    def test_output_dir_created_if_missing(self, fresh_bracket, tmp_path):
         nested_output = str(tmp_path / "deep" / "nested" / "run1.txt")
-        tournament = Tournament(_make_test_bracket(), AlwaysFirstSimulator(), nested_output)
+        tournament = Tournament(fresh_bracket, AlwaysFirstSimulator(), nested_output)
         tournament.run()
         assert os.path.exists(nested_output)
 
-    def test_correct_total_game_count(self, tmp_path):
+    def test_run_closes_simulator(self, fresh_bracket, tmp_path):
+        sim = AlwaysFirstSimulator()
+        Tournament(fresh_bracket, sim, str(tmp_path / "run1.txt")).run()
+        assert sim.closed is True
+
+    def test_correct_total_game_count(self, fresh_bracket, tmp_path):
         """63 total games: 32+16+8+4+2+1."""
         output_file = str(tmp_path / "run1.txt")
         sim = CountingSimulator()
-        tournament = Tournament(_make_test_bracket(), sim, output_file)
+        tournament = Tournament(fresh_bracket, sim, output_file)
         tournament.run()
         assert sim.call_count == 63
 
-    def test_winner_appears_as_champion(self, tmp_path):
-        output_file = str(tmp_path / "run1.txt")
-        tournament = Tournament(_make_test_bracket(), AlwaysFirstSimulator(), output_file)
-        tournament.run()
-        content = open(output_file).read()
+    def test_winner_appears_as_champion(self, always_first_run_content):
+        content = always_first_run_content
         assert "MASCOT MADNESS CHAMPION" in content
 
-    def test_default_output_path(self):
-        tournament = Tournament(_make_test_bracket(), AlwaysFirstSimulator())
-        assert tournament.output_file == "output/run1.txt"
+    def test_unknown_winner_raises(self, fresh_bracket, tmp_path):
+        tournament = Tournament(
+            fresh_bracket, WrongWinnerSimulator(), str(tmp_path / "run1.txt")
+        )
+        with pytest.raises(ValueError, match="Somebody Else"):
+            tournament.run()
 
-    def test_game_narratives_appear_in_output(self, tmp_path):
-        output_file = str(tmp_path / "run1.txt")
-        tournament = Tournament(_make_test_bracket(), AlwaysFirstSimulator(), output_file)
-        tournament.run()
-        content = open(output_file).read()
+    def test_game_narratives_appear_in_output(self, always_first_run_content):
+        content = always_first_run_content
         assert "crushed" in content  # from AlwaysFirstSimulator narrative
 
-    def test_win_probability_appears_in_output(self, tmp_path):
-        output_file = str(tmp_path / "run1.txt")
-        tournament = Tournament(_make_test_bracket(), AlwaysFirstSimulator(), output_file)
-        tournament.run()
-        content = open(output_file).read()
+    def test_win_probability_appears_in_output(self, always_first_run_content):
+        content = always_first_run_content
         assert "99%" in content  # AlwaysFirstSimulator uses 99%
 
-    def test_mock_fight_simulator_integration(self, tmp_path):
+    def test_mock_fight_simulator_integration(self, fresh_bracket, tmp_path):
         """Full run with the real FightSimulator in mock mode."""
         output_file = str(tmp_path / "run1.txt")
         sim = FightSimulator(mock_mode=True)
-        tournament = Tournament(_make_test_bracket(), sim, output_file)
+        tournament = Tournament(fresh_bracket, sim, output_file)
         tournament.run()
         assert os.path.exists(output_file)
-        content = open(output_file).read()
+        content = Path(output_file).read_text()
         assert "MASCOT MADNESS CHAMPION" in content
+
+
+@pytest.mark.slow
+class TestTournamentConcurrency:
+
+    def test_divisions_and_games_run_concurrently(self, fresh_bracket, tmp_path):
+        sim = ConcurrencyTrackingSimulator()
+        tournament = Tournament(
+            fresh_bracket, sim, str(tmp_path / "run1.txt"), max_concurrent=64
+        )
+        tournament.run()
+        # Round of 64: 8 independent games in each of the 4 divisions
+        assert sim.peak_in_flight == 32
+
+    def test_max_concurrent_caps_fights_in_flight(self, fresh_bracket, tmp_path):
+        sim = ConcurrencyTrackingSimulator()
+        tournament = Tournament(
+            fresh_bracket, sim, str(tmp_path / "run1.txt"), max_concurrent=3
+        )
+        tournament.run()
+        assert sim.peak_in_flight == 3
+
+    def test_division_sections_are_not_interleaved(self, fresh_bracket, tmp_path):
+        output_file = str(tmp_path / "run1.txt")
+        tournament = Tournament(fresh_bracket, OutOfOrderSimulator(), output_file)
+        tournament.run()
+        content = Path(output_file).read_text()
+        headers = [content.index(f"{div} DIVISION") for div in ["WEST", "EAST", "SOUTH", "MIDWEST"]]
+        assert headers == sorted(headers)
+        west_section = content[headers[0]:headers[1]]
+        assert "East_Team" not in west_section
+        assert west_section.count("Game 1:") == 4  # one per round
+
+    def test_semifinals_run_concurrently(self, fresh_bracket, tmp_path):
+        sim = EventLogSimulator()
+        Tournament(fresh_bracket, sim, str(tmp_path / "run1.txt")).run()
+        semifinals = [("West_Team_1", "East_Team_1"), ("South_Team_1", "Midwest_Team_1")]
+        starts = [sim.events.index(("start", *pair)) for pair in semifinals]
+        ends = [sim.events.index(("end", *pair)) for pair in semifinals]
+        assert max(starts) < min(ends)
+        # The championship waits for both semifinals
+        assert sim.events[-2] == ("start", "West_Team_1", "South_Team_1")
+
+    def test_out_of_order_completion_preserves_matchup_order(self, fresh_bracket, tmp_path):
+        output_file = str(tmp_path / "run1.txt")
+        tournament = Tournament(fresh_bracket, OutOfOrderSimulator(), output_file)
+        tournament.run()
+        content = Path(output_file).read_text()
+        # team1 always wins, so the 1-seed must survive every round
+        for div in ["WEST", "EAST", "SOUTH", "MIDWEST"]:
+            assert f"{div} CHAMPION: {div}_TEAM_1 ***" in content
+
+    def test_run_async_can_be_awaited_directly(self, fresh_bracket, tmp_path):
+        output_file = str(tmp_path / "run1.txt")
+        tournament = Tournament(fresh_bracket, AlwaysFirstSimulator(), output_file)
+        asyncio.run(tournament.run_async())
+        assert os.path.exists(output_file)
+
+
+@pytest.mark.slow
+class TestTournamentBatchApi:
+
+    def test_each_round_submitted_as_one_batch(self, fresh_bracket, tmp_path):
+        sim = BatchRecordingSimulator()
+        tournament = Tournament(
+            fresh_bracket, sim, str(tmp_path / "run1.txt"), use_batch_api=True
+        )
+        tournament.run()
+        assert sim.batch_sizes == [32, 16, 8, 4, 2]
+        assert sim.single_fights == 1  # championship
+
+    def test_batched_output_matches_concurrent_output(self, make_bracket, tmp_path):
+        batched_file = tmp_path / "batched.txt"
+        concurrent_file = tmp_path / "concurrent.txt"
+        Tournament(
+            make_bracket(), BatchRecordingSimulator(), str(batched_file), use_batch_api=True
+        ).run()
+        Tournament(make_bracket(), AlwaysFirstSimulator(), str(concurrent_file)).run()
+        assert batched_file.read_text() == concurrent_file.read_text()